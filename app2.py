@@ -0,0 +1,17 @@
+import streamlit as st
+st.set_page_config(page_title="Visor ISV", layout="wide")
+
+
+import sys
+import os
+sys.path.append(os.path.abspath(os.path.dirname(__file__)))
+
+from nucleo.regiones import REGIONES
+from paginas.registro import PAGINAS, mostrar_pagina
+
+# Selector de región y de página en la barra lateral
+clave_region = st.sidebar.selectbox("Región", list(REGIONES), format_func=lambda c: REGIONES[c].nombre)
+pagina = st.sidebar.selectbox("Selecciona una página", list(PAGINAS))
+
+# Mostrar el contenido según la página seleccionada (se importa solo esa página)
+mostrar_pagina(pagina, REGIONES[clave_region])
@@ -0,0 +1,54 @@
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+# ============================
+# BENCHMARK DE ARRANQUE
+# ============================
+# Compara el costo de importar todas las páginas al inicio (como hacía app2.py)
+# contra cargar solo la página seleccionada a través de paginas.registro.
+# Cada medición usa un intérprete nuevo para que no haya módulos en cache.
+#
+#   python benchmarks/arranque.py --repeticiones 5
+
+RAIZ = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+def medir(codigo, carpeta_app, repeticiones):
+    tiempos = []
+    for _ in range(repeticiones):
+        inicio = time.perf_counter()
+        subprocess.run([sys.executable, "-c", codigo], cwd=carpeta_app, check=True,
+                       stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        tiempos.append((time.perf_counter() - inicio) * 1000)
+    return statistics.median(tiempos)
+
+def main():
+    parser = argparse.ArgumentParser(description="Tiempo de arranque: páginas eager vs. registro perezoso")
+    parser.add_argument("--repeticiones", type=int, default=5)
+    args = parser.parse_args()
+
+    carpeta_app = RAIZ
+    sys.path.insert(0, carpeta_app)
+    from paginas.registro import PAGINAS
+
+    preambulo = "import sys; sys.path.insert(0, '.'); import streamlit\n"
+    escenarios = [("intérprete vacío", "pass"), ("solo streamlit", preambulo)]
+    escenarios.append((
+        "todas las páginas (antes)",
+        preambulo + "".join(f"import {modulo}\n" for modulo in dict.fromkeys(m for m, *_ in PAGINAS.values())),
+    ))
+    for nombre in PAGINAS:
+        escenarios.append((
+            f"solo '{nombre}' (registro)",
+            preambulo + f"from paginas.registro import cargar_pagina\ncargar_pagina({nombre!r})\n",
+        ))
+
+    print(f"{'escenario':<40} {'mediana (ms)':>12}")
+    for nombre, codigo in escenarios:
+        print(f"{nombre:<40} {medir(codigo, carpeta_app, args.repeticiones):>12.1f}")
+
+if __name__ == "__main__":
+    main()
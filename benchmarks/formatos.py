@@ -0,0 +1,82 @@
+import argparse
+import os
+import statistics
+import sys
+import time
+
+# ============================
+# BENCHMARK KML vs KMZ
+# ============================
+# Tiempo de lectura de coordenadas de cada ruta de tus_kmz desde el KML plano
+# (mmap) y desde el KMZ (inflado del deflate), sin pasar por cache_rutas. Solo
+# se comparan las rutas que tienen ambos formatos con un KML no vacío. Las
+# rutas cuyo KML no coincide con el KMZ se marcan (la app usa el KMZ en ellas).
+#
+#   python benchmarks/formatos.py --repeticiones 3
+#   python benchmarks/formatos.py --region sur --detalle
+
+RAIZ = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+def medir(funcion, ruta, repeticiones):
+    tiempos = []
+    for _ in range(repeticiones):
+        inicio = time.perf_counter()
+        coords = funcion(ruta)
+        tiempos.append((time.perf_counter() - inicio) * 1000)
+    return statistics.median(tiempos), len(coords)
+
+def pares_kml_kmz(carpeta):
+    from nucleo.catalogo import kml_vacio, partes_nombre
+
+    por_nombre = {}
+    for archivo in sorted(os.listdir(carpeta)):
+        extension = os.path.splitext(archivo)[1].lower()
+        if extension in (".kml", ".kmz"):
+            por_nombre.setdefault(partes_nombre(archivo), {})[extension] = os.path.join(carpeta, archivo)
+    return [
+        (f"{nombre}_{id_ruta}", grupo[".kml"], grupo[".kmz"])
+        for (nombre, id_ruta), grupo in por_nombre.items()
+        if ".kml" in grupo and ".kmz" in grupo and not kml_vacio(grupo[".kml"])
+    ]
+
+def main():
+    parser = argparse.ArgumentParser(description="Lectura de rutas: KML plano (mmap) vs. KMZ")
+    parser.add_argument("--repeticiones", type=int, default=3)
+    parser.add_argument("--region", action="append", help="clave de región (por defecto, todas)")
+    parser.add_argument("--detalle", action="store_true", help="muestra el tiempo de cada ruta")
+    args = parser.parse_args()
+
+    sys.path.insert(0, RAIZ)
+    from nucleo.kml import leer_coordenadas_kml, leer_coordenadas_kmz
+    from nucleo.regiones import REGIONES
+
+    total_kml = total_kmz = 0.0
+    bytes_kml = bytes_kmz = 0
+    for clave in args.region or list(REGIONES):
+        region = REGIONES[clave]
+        if not os.path.isdir(region.carpeta_kmz):
+            continue
+        pares = pares_kml_kmz(region.carpeta_kmz)
+        if args.detalle:
+            print(f"\n{region.nombre}")
+            print(f"{'ruta':<50} {'puntos':>8} {'KML (ms)':>9} {'KMZ (ms)':>9}")
+        for nombre, kml, kmz in pares:
+            t_kml, n_kml = medir(leer_coordenadas_kml, kml, args.repeticiones)
+            t_kmz, n_kmz = medir(leer_coordenadas_kmz, kmz, args.repeticiones)
+            if n_kml != n_kmz:
+                print(f"⚠️ {nombre}: el KML tiene {n_kml} puntos y el KMZ {n_kmz}")
+            total_kml += t_kml
+            total_kmz += t_kmz
+            bytes_kml += os.path.getsize(kml)
+            bytes_kmz += os.path.getsize(kmz)
+            if args.detalle:
+                print(f"{nombre[:50]:<50} {n_kml:>8} {t_kml:>9.1f} {t_kmz:>9.1f}")
+
+    print(f"\n{'formato':<10} {'MB en disco':>12} {'total (ms)':>12}")
+    print(f"{'KML mmap':<10} {bytes_kml / 1e6:>12.1f} {total_kml:>12.1f}")
+    print(f"{'KMZ':<10} {bytes_kmz / 1e6:>12.1f} {total_kmz:>12.1f}")
+    if total_kml:
+        print(f"KMZ / KML: {total_kmz / total_kml:.2f}x")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1 @@
+# Utilidades compartidas por las páginas (geodesia, lectura de rutas, caches)
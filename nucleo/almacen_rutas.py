@@ -0,0 +1,179 @@
+import hashlib
+import os
+import shutil
+import threading
+from dataclasses import dataclass, field
+
+import numpy as np
+
+from nucleo.geodesia import distancia_acumulada
+from nucleo.kml import leer_coordenadas_kml, leer_coordenadas_kmz
+from nucleo.segmentacion import RutaSegmentada, segmentar_por_km
+from nucleo.simplificacion import niveles_simplificados
+
+# ============================
+# ALMACÉN DE RUTAS PREPROCESADAS
+# ============================
+# Cada KML/KMZ se parsea y segmenta una sola vez; el resultado (coordenadas,
+# distancia acumulada, índices de corte por km y los vértices que sobreviven a
+# cada nivel de simplificación) se guarda como un .npy por arreglo en
+# <proyecto>/cache_rutas y se reutiliza mientras el archivo fuente no cambie
+# (misma ruta, mtime y tamaño). Los .npy se abren con mmap_mode="r": todas
+# las sesiones y procesos que miran la misma ruta comparten las mismas
+# páginas del cache del sistema operativo en vez de tener cada uno su copia.
+
+NOMBRE_CARPETA_CACHE = "cache_rutas"
+VERSION_FORMATO = 4
+
+@dataclass
+class RutaProcesada:
+    coords: np.ndarray      # (N, 3) lon, lat, ele, con los puntos de corte interpolados
+    dist_acum: np.ndarray   # (N,) metros desde el primer vértice
+    cortes: np.ndarray      # índices de vértice donde empieza/termina cada km (ver segmentacion)
+    simplificados: dict = field(default_factory=dict)  # zoom -> índices de vértice conservados
+
+    @property
+    def longitud_m(self):
+        return float(self.dist_acum[-1]) if len(self.dist_acum) else 0.0
+
+    @property
+    def bounds(self):
+        lon_min, lat_min = self.coords[:, :2].min(axis=0)
+        lon_max, lat_max = self.coords[:, :2].max(axis=0)
+        return [[float(lat_min), float(lon_min)], [float(lat_max), float(lon_max)]]
+
+    # Tramos por km como RutaSegmentada sobre self.coords. Con un nivel de
+    # simplificación se arma un solo arreglo con los vértices conservados en
+    # ese nivel; los cortes siempre lo están, así que cada tramo mantiene sus
+    # extremos.
+    def segmentos(self, nivel=None):
+        if nivel is None or nivel not in self.simplificados:
+            return RutaSegmentada(self.coords, self.cortes)
+        indices = self.simplificados[nivel]
+        return RutaSegmentada(self.coords[indices, :2], np.searchsorted(indices, self.cortes))
+
+    # Trazado completo (lon, lat) al nivel de simplificación pedido
+    def trazado(self, nivel=None):
+        if nivel is None or nivel not in self.simplificados:
+            return self.coords[:, :2]
+        return self.coords[self.simplificados[nivel], :2]
+
+def procesar_ruta(ruta_fuente):
+    if ruta_fuente.lower().endswith(".kmz"):
+        coords = leer_coordenadas_kmz(ruta_fuente)
+    else:
+        coords = leer_coordenadas_kml(ruta_fuente)
+    if len(coords) < 2:
+        raise ValueError(f"La ruta {os.path.basename(ruta_fuente)} tiene menos de dos vértices.")
+    coords, dist_acum, cortes = segmentar_por_km(coords, distancia_acumulada(coords))
+    return RutaProcesada(
+        coords=coords,
+        dist_acum=dist_acum,
+        cortes=cortes,
+        simplificados=niveles_simplificados(coords, cortes),
+    )
+
+# ============================
+# CACHE EN DISCO
+# ============================
+
+def carpeta_cache_para(ruta_fuente):
+    # tus_kmz/<archivo> -> <proyecto>/cache_rutas
+    carpeta_fuentes = os.path.dirname(os.path.abspath(ruta_fuente))
+    return os.path.join(os.path.dirname(carpeta_fuentes), NOMBRE_CARPETA_CACHE)
+
+def huella_fuente(ruta_fuente):
+    info = os.stat(ruta_fuente)
+    texto = f"{os.path.abspath(ruta_fuente)}|{info.st_mtime_ns}|{info.st_size}|v{VERSION_FORMATO}"
+    return hashlib.sha1(texto.encode("utf-8")).hexdigest()
+
+def _nombre_cache(ruta_fuente):
+    return hashlib.sha1(os.path.abspath(ruta_fuente).encode("utf-8")).hexdigest()[:20]
+
+# Una carpeta por versión del archivo fuente: lo que ya está escrito no se
+# modifica nunca, así que un lector jamás ve un arreglo a medio escribir.
+def _carpeta_ruta(ruta_fuente, carpeta_cache, huella):
+    return os.path.join(carpeta_cache, f"{_nombre_cache(ruta_fuente)}_{huella[:16]}")
+
+_ARREGLOS = ("coords", "dist_acum", "cortes")
+_PREFIJO_NIVEL = "simplificado_"
+
+def _leer_cache(carpeta):
+    try:
+        arreglos = {
+            nombre: np.load(os.path.join(carpeta, f"{nombre}.npy"), mmap_mode="r", allow_pickle=False)
+            for nombre in _ARREGLOS
+        }
+        simplificados = {
+            int(archivo[len(_PREFIJO_NIVEL):-len(".npy")]): np.load(
+                os.path.join(carpeta, archivo), mmap_mode="r", allow_pickle=False
+            )
+            for archivo in os.listdir(carpeta)
+            if archivo.startswith(_PREFIJO_NIVEL) and archivo.endswith(".npy")
+        }
+        return RutaProcesada(simplificados=simplificados, **arreglos)
+    except (OSError, ValueError):
+        return None
+
+# Se escribe en una carpeta temporal y se renombra de una vez; si otro
+# proceso ganó la carrera se descarta la copia propia. Después se borran las
+# versiones anteriores de la misma ruta (en Linux los mmap abiertos sobre
+# ellas siguen siendo válidos hasta que se cierran).
+def _escribir_cache(carpeta, ruta):
+    temporal = f"{carpeta}.{os.getpid()}.{threading.get_ident()}.tmp"
+    os.makedirs(temporal, exist_ok=True)
+    try:
+        for nombre in _ARREGLOS:
+            np.save(os.path.join(temporal, f"{nombre}.npy"), np.ascontiguousarray(getattr(ruta, nombre)))
+        for zoom, indices in ruta.simplificados.items():
+            np.save(os.path.join(temporal, f"{_PREFIJO_NIVEL}{zoom}.npy"), np.ascontiguousarray(indices))
+        os.rename(temporal, carpeta)
+    except OSError:
+        shutil.rmtree(temporal, ignore_errors=True)
+        if not os.path.isdir(carpeta):
+            raise
+        return
+    _borrar_versiones_viejas(carpeta)
+
+def _borrar_versiones_viejas(carpeta, actual=None):
+    carpeta_cache, actual = os.path.split(carpeta) if actual is None else (carpeta, actual)
+    prefijo = actual.rsplit("_", 1)[0]
+    for archivo in os.listdir(carpeta_cache):
+        if archivo == f"{prefijo}.npz":
+            # formato anterior a los .npy
+            try:
+                os.remove(os.path.join(carpeta_cache, archivo))
+            except OSError:
+                pass
+        elif archivo.startswith(f"{prefijo}_") and archivo != actual and not archivo.endswith(".tmp"):
+            shutil.rmtree(os.path.join(carpeta_cache, archivo), ignore_errors=True)
+
+# Borra todo lo guardado para `ruta_fuente` (p. ej. el KML de una ruta que se
+# lee desde el KMZ: no tiene sentido guardar ambos)
+def descartar_cache(ruta_fuente, carpeta_cache=None):
+    carpeta_cache = carpeta_cache or carpeta_cache_para(ruta_fuente)
+    if os.path.isdir(carpeta_cache):
+        _borrar_versiones_viejas(carpeta_cache, f"{_nombre_cache(ruta_fuente)}_")
+
+# La ruta preprocesada si ya está en el cache y al día, o None; nunca parsea
+# el archivo fuente, así que las páginas la pueden pedir sin bloquear.
+def ruta_en_cache(ruta_fuente, carpeta_cache=None):
+    carpeta_cache = carpeta_cache or carpeta_cache_para(ruta_fuente)
+    return _leer_cache(_carpeta_ruta(ruta_fuente, carpeta_cache, huella_fuente(ruta_fuente)))
+
+# Devuelve la ruta preprocesada desde el cache, reconstruyéndola solo si el
+# archivo fuente cambió desde la última vez.
+def cargar_ruta(ruta_fuente, carpeta_cache=None):
+    carpeta_cache = carpeta_cache or carpeta_cache_para(ruta_fuente)
+    carpeta = _carpeta_ruta(ruta_fuente, carpeta_cache, huella_fuente(ruta_fuente))
+
+    ruta = _leer_cache(carpeta)
+    if ruta is None:
+        ruta = procesar_ruta(ruta_fuente)
+        try:
+            _escribir_cache(carpeta, ruta)
+        except OSError:
+            return ruta  # sin permisos de escritura: se sigue sin cache
+        # también quien la construyó usa las páginas compartidas del mmap
+        ruta = _leer_cache(carpeta) or ruta
+    return ruta
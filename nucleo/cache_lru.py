@@ -0,0 +1,143 @@
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass, fields, is_dataclass
+
+import numpy as np
+
+# ============================
+# CACHE LRU CON PRESUPUESTO EN BYTES
+# ============================
+# Estado por ruta que antes vivía en st.session_state (una copia por sesión
+# y por cada ruta visitada, sin límite). Aquí hay una sola instancia por
+# proceso: las entradas se cuentan en bytes y, al pasar el presupuesto, se
+# desaloja la usada hace más tiempo. Los arreglos abiertos con mmap (ver
+# almacen_rutas) no cuentan: sus páginas son del cache del sistema, no del
+# proceso.
+
+PRESUPUESTO_MB = 256
+
+# Bytes propios del valor: arreglos numpy (salvo memmap), dataclasses,
+# objetos con __slots__ como RutaSegmentada, y listas/tuplas/dicts de ellos.
+def tamano_bytes(valor):
+    if isinstance(valor, np.memmap):
+        return 0
+    if isinstance(valor, np.ndarray):
+        return valor.nbytes
+    if isinstance(valor, (list, tuple)):
+        return sum(tamano_bytes(v) for v in valor)
+    if isinstance(valor, dict):
+        return sum(tamano_bytes(v) for v in valor.values())
+    if is_dataclass(valor):
+        return sum(tamano_bytes(getattr(valor, f.name)) for f in fields(valor))
+    if hasattr(valor, "__slots__"):
+        return sum(tamano_bytes(getattr(valor, nombre, None)) for nombre in valor.__slots__)
+    return 0
+
+@dataclass
+class EstadisticasCache:
+    aciertos: int
+    fallos: int
+    desalojos: int
+    entradas: int
+    bytes_usados: int
+    presupuesto_bytes: int
+
+    @property
+    def tasa_aciertos(self):
+        total = self.aciertos + self.fallos
+        return self.aciertos / total if total else 0.0
+
+class CacheLRU:
+    def __init__(self, presupuesto_bytes):
+        self.presupuesto_bytes = presupuesto_bytes
+        self._entradas = OrderedDict()  # clave -> (valor, bytes), la más reciente al final
+        self._bytes = 0
+        self._candado = threading.Lock()
+        self.aciertos = 0
+        self.fallos = 0
+        self.desalojos = 0
+
+    def __len__(self):
+        return len(self._entradas)
+
+    def __contains__(self, clave):
+        return clave in self._entradas
+
+    def obtener(self, clave, defecto=None):
+        with self._candado:
+            entrada = self._entradas.get(clave)
+            if entrada is None:
+                self.fallos += 1
+                return defecto
+            self._entradas.move_to_end(clave)
+            self.aciertos += 1
+            return entrada[0]
+
+    # Un valor más grande que todo el presupuesto no se guarda
+    def guardar(self, clave, valor):
+        tamano = tamano_bytes(valor)
+        with self._candado:
+            anterior = self._entradas.pop(clave, None)
+            if anterior is not None:
+                self._bytes -= anterior[1]
+            if tamano > self.presupuesto_bytes:
+                return valor
+            self._entradas[clave] = (valor, tamano)
+            self._bytes += tamano
+            self._desalojar()
+        return valor
+
+    # Devuelve el valor de `clave`, construyéndolo con construir() si no está.
+    # construir() corre fuera del candado: dos sesiones que fallan a la vez
+    # pueden construirlo ambas, y gana la última en guardarlo.
+    def obtener_o_construir(self, clave, construir):
+        centinela = object()
+        valor = self.obtener(clave, centinela)
+        if valor is centinela:
+            valor = self.guardar(clave, construir())
+        return valor
+
+    def descartar(self, clave):
+        with self._candado:
+            anterior = self._entradas.pop(clave, None)
+            if anterior is not None:
+                self._bytes -= anterior[1]
+
+    def limpiar(self):
+        with self._candado:
+            self._entradas.clear()
+            self._bytes = 0
+
+    def ajustar_presupuesto(self, presupuesto_bytes):
+        with self._candado:
+            self.presupuesto_bytes = presupuesto_bytes
+            self._desalojar()
+
+    def _desalojar(self):
+        while self._bytes > self.presupuesto_bytes and self._entradas:
+            _, (_, tamano) = self._entradas.popitem(last=False)
+            self._bytes -= tamano
+            self.desalojos += 1
+
+    def estadisticas(self):
+        with self._candado:
+            return EstadisticasCache(
+                aciertos=self.aciertos,
+                fallos=self.fallos,
+                desalojos=self.desalojos,
+                entradas=len(self._entradas),
+                bytes_usados=self._bytes,
+                presupuesto_bytes=self.presupuesto_bytes,
+            )
+
+# Un solo cache de estado por ruta para todo el proceso, compartido por todas
+# las sesiones (igual que cola_compartida).
+_cache_rutas = None
+_candado_cache = threading.Lock()
+
+def cache_rutas_compartido():
+    global _cache_rutas
+    with _candado_cache:
+        if _cache_rutas is None:
+            _cache_rutas = CacheLRU(PRESUPUESTO_MB * 1024 * 1024)
+    return _cache_rutas
@@ -0,0 +1,184 @@
+import hashlib
+import json
+import os
+import threading
+
+from nucleo.almacen_rutas import VERSION_FORMATO, cargar_ruta, huella_fuente
+from nucleo.catalogo import catalogo_rutas
+from nucleo.clasificacion import clasificar
+from nucleo.indices_excel import huella_libro, valores_ruta
+from nucleo.mapa import coleccion_tramos
+from nucleo.simplificacion import NIVEL_GLOBAL
+from nucleo.trabajos import FALLIDO, cola_compartida
+
+# ============================
+# CAPA GLOBAL PRECALCULADA
+# ============================
+# El mapa global de una región (todas las rutas, un tipo de índice) se arma
+# una vez como FeatureCollection y se guarda como JSON en
+# <región>/cache_global, junto con la huella de sus entradas (todos los KMZ y
+# el libro de índices). Mientras las entradas no cambien se sirve tal cual;
+# si cambian, se sigue mostrando la versión anterior y se reconstruye en la
+# cola de trabajos en segundo plano.
+#
+# La reconstrucción es incremental: por cada ruta se guardan sus tramos junto
+# con la huella de su KMZ y un hash de su columna en el Excel, y solo se
+# vuelven a procesar las rutas en que alguna de las dos cambió.
+
+NOMBRE_CARPETA_CACHE = "cache_global"
+
+LISTA = "lista"
+DESACTUALIZADA = "desactualizada"
+CONSTRUYENDO = "construyendo"
+
+# (ruta, archivo fuente) por cada ruta del catálogo de la carpeta tus_kmz
+def rutas_region(region):
+    return [(entrada.id, entrada.fuente) for entrada in catalogo_rutas(region.carpeta_kmz)]
+
+def huella_capa(region, tipo):
+    archivo_excel, hoja = region.fuente(tipo)
+    partes = [tipo, hoja, huella_libro(archivo_excel), f"z{NIVEL_GLOBAL}", f"v{VERSION_FORMATO}"]
+    partes += [huella_fuente(kmz_path) for _, kmz_path in rutas_region(region)]
+    return hashlib.sha1("|".join(partes).encode("utf-8")).hexdigest()
+
+def huella_columna(valores):
+    if valores is None:
+        return "sin_datos"
+    return hashlib.sha1(valores.tobytes()).hexdigest()[:16]
+
+def _archivo_capa(region, tipo):
+    return os.path.join(region.carpeta, NOMBRE_CARPETA_CACHE, f"capa_{tipo}_z{NIVEL_GLOBAL}.json")
+
+def _procesar_ruta(ruta, kmz_path, valores):
+    segmentos = cargar_ruta(kmz_path).segmentos(NIVEL_GLOBAL)
+    categorias = clasificar(valores, len(segmentos))
+    features = coleccion_tramos(segmentos, categorias)["features"]
+    for feature in features:
+        feature["properties"]["ruta"] = ruta
+    return features
+
+# Devuelve {ruta: entrada} con una entrada por ruta de la región:
+# {"kmz": huella, "columna": hash, "features": [...], "error": None o texto}.
+# Las entradas de `previas` cuyas huellas coinciden se reutilizan sin tocar
+# el KMZ. Una ruta que falla queda con su error y no detiene al resto.
+# al_avanzar(hechos, total, ruta) se llama al empezar cada ruta.
+def construir_rutas(region, tipo, previas=None, al_avanzar=None):
+    archivo_excel, hoja = region.fuente(tipo)
+    previas = previas or {}
+    rutas = {}
+    lista = rutas_region(region)
+    for hechos, (ruta, kmz_path) in enumerate(lista, start=1):
+        if al_avanzar is not None:
+            al_avanzar(hechos, len(lista), ruta)
+        entrada = {"kmz": None, "columna": None, "features": [], "error": None}
+        try:
+            valores = valores_ruta(archivo_excel, hoja, ruta)
+            entrada["kmz"] = huella_fuente(kmz_path)
+            entrada["columna"] = huella_columna(valores)
+            previa = previas.get(ruta)
+            if (
+                previa is not None
+                and previa["error"] is None
+                and previa["kmz"] == entrada["kmz"]
+                and previa["columna"] == entrada["columna"]
+            ):
+                rutas[ruta] = previa
+                continue
+            entrada["features"] = _procesar_ruta(ruta, kmz_path, valores)
+        except Exception as e:
+            entrada["error"] = str(e)
+        rutas[ruta] = entrada
+    return rutas
+
+# FeatureCollection y lista de errores [ruta, mensaje] a partir de las
+# entradas por ruta
+def armar_capa(rutas):
+    features, errores = [], []
+    for ruta in sorted(rutas):
+        entrada = rutas[ruta]
+        features.extend(entrada["features"])
+        if entrada["error"] is not None:
+            errores.append([ruta, entrada["error"]])
+    return {"type": "FeatureCollection", "features": features}, errores
+
+def _datos_capa(huella, rutas):
+    coleccion, errores = armar_capa(rutas)
+    return {"huella": huella, "rutas": rutas, "coleccion": coleccion, "errores": errores}
+
+def _leer_capa(archivo):
+    try:
+        with open(archivo, encoding="utf-8") as f:
+            guardado = json.load(f)
+        return _datos_capa(guardado["huella"], guardado["rutas"])
+    except (OSError, ValueError, KeyError, TypeError):
+        return None
+
+def _escribir_capa(archivo, huella, rutas):
+    os.makedirs(os.path.dirname(archivo), exist_ok=True)
+    temporal = f"{archivo}.{os.getpid()}.{threading.get_ident()}.tmp"
+    with open(temporal, "w", encoding="utf-8") as f:
+        json.dump({"huella": huella, "rutas": rutas}, f, separators=(",", ":"))
+    os.replace(temporal, archivo)
+
+# ============================
+# SERVICIO DE LA CAPA
+# ============================
+# Las capas ya leídas quedan en memoria del proceso, y a lo más hay una
+# reconstrucción en curso por (región, tipo, huella): la cola de trabajos
+# devuelve la misma si se pide de nuevo.
+
+_capas = {}       # (región, tipo) -> datos del JSON
+_candado = threading.Lock()
+
+def _clave_trabajo(region, tipo, huella):
+    return ("capa_global", region.clave, tipo, huella)
+
+def _reconstruir(trabajo, region, tipo, huella, previa):
+    def al_avanzar(hechos, total, ruta):
+        trabajo.informar(hechos / total, f"Procesado {ruta} ({hechos}/{total})")
+
+    rutas = construir_rutas(region, tipo, previa["rutas"] if previa else None, al_avanzar)
+    datos = _datos_capa(huella, rutas)
+    try:
+        _escribir_capa(_archivo_capa(region, tipo), huella, rutas)
+    except OSError:
+        pass  # sin permisos de escritura: queda solo en memoria
+    with _candado:
+        _capas[(region.clave, tipo)] = datos
+
+def _lanzar_reconstruccion(region, tipo, huella, previa):
+    return cola_compartida().enviar(
+        _clave_trabajo(region, tipo, huella),
+        _reconstruir, region, tipo, huella, previa,
+        descripcion=f"Capa global {tipo} de {region.nombre}",
+        recibe_trabajo=True,
+    )
+
+# Devuelve (coleccion, errores, estado). Con estado DESACTUALIZADA la colección
+# es la versión anterior y ya hay una reconstrucción en curso; con CONSTRUYENDO
+# todavía no existe ninguna versión y la colección es None.
+def capa_global(region, tipo):
+    huella = huella_capa(region, tipo)
+    clave = (region.clave, tipo)
+
+    datos = _capas.get(clave)
+    if datos is None:
+        datos = _leer_capa(_archivo_capa(region, tipo))
+        if datos is not None:
+            with _candado:
+                _capas.setdefault(clave, datos)
+    if datos is not None and datos["huella"] == huella:
+        return datos["coleccion"], datos["errores"], LISTA
+
+    # Una reconstrucción fallida no se relanza hasta que cambien las entradas
+    trabajo = cola_compartida().obtener(_clave_trabajo(region, tipo, huella))
+    if trabajo is None or trabajo.estado != FALLIDO:
+        _lanzar_reconstruccion(region, tipo, huella, datos)
+    if datos is not None:
+        return datos["coleccion"], datos["errores"], DESACTUALIZADA
+    return None, [], CONSTRUYENDO
+
+# Trabajo de reconstrucción en curso (o recién terminado) para las entradas
+# actuales, o None
+def trabajo_capa(region, tipo):
+    return cola_compartida().obtener(_clave_trabajo(region, tipo, huella_capa(region, tipo)))
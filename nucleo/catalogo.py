@@ -0,0 +1,328 @@
+import hashlib
+import json
+import os
+import threading
+from dataclasses import asdict, dataclass
+
+from nucleo.almacen_rutas import NOMBRE_CARPETA_CACHE, cargar_ruta, descartar_cache
+from nucleo.geodesia import distancia_acumulada
+from nucleo.kml import leer_coordenadas_kml, leer_coordenadas_kmz
+
+# ============================
+# CATÁLOGO DE RUTAS
+# ============================
+# Un solo índice por carpeta tus_kmz: id de ruta -> archivos KML/KMZ, nombre,
+# vértices, longitud y bounds. Se arma una vez y se guarda en
+# <proyecto>/cache_rutas/catalogo.json; se vuelve a revisar solo cuando
+# cambia el mtime de la carpeta (archivos agregados, borrados o renombrados),
+# y aun así las entradas cuyos archivos no cambiaron se reutilizan.
+#
+# Los archivos se llaman "<nombre>_<id>.kml|.kmz". El id es exactamente lo que
+# sigue al último "_" (así "R-300 IDA_R-300 (148)" y "R-300 IDA_R-300" son
+# rutas distintas aunque compartan nombre). Si un nombre tiene solo un KML y
+# un KMZ y traen ids distintos (31-CH en norte), quedan en una sola entrada
+# con el id del KMZ, y el otro id como alias. Un id
+# repetido en dos nombres distintos queda con el primer nombre en orden
+# alfabético, como la búsqueda por sufijo que reemplaza.
+#
+# Cada entrada recuerda también de qué archivo se lee la geometría. El KML
+# plano (leído con mmap, sin inflar nada) se usa solo si tiene la misma
+# geometría que el KMZ (mismos vértices y longitud); si no, manda el KMZ, que
+# es lo que las páginas usaban siempre, y la diferencia queda en `error`. La
+# comparación solo parsea; al almacén de rutas entra únicamente el ganador. Los
+# KML vacíos o solo con espacios (31-CH, Ruta-5-1034 en norte) ni se abren.
+
+NOMBRE_CATALOGO = "catalogo.json"
+VERSION_CATALOGO = 6
+
+@dataclass
+class EntradaRuta:
+    id: str
+    nombre: str
+    kml: str = None         # rutas absolutas, o None si falta ese formato
+    kmz: str = None
+    alias: tuple = ()
+    puntos: int = 0
+    longitud_m: float = None
+    bounds: list = None
+    error: str = None       # por qué no se pudo leer la ruta, o por qué no se usa el KML
+    firma: str = ""         # mtime y tamaño de los archivos al leerla
+    formato: str = None     # "kml" o "kmz": el que se usó para leerla
+    puntos_kml: int = None  # lo leído de cada formato, para compararlos
+    longitud_kml_m: float = None
+    puntos_kmz: int = None
+    longitud_kmz_m: float = None
+
+    # Archivo a abrir para la geometría
+    @property
+    def fuente(self):
+        if self.formato == "kmz":
+            return self.kmz
+        if self.formato == "kml":
+            return self.kml
+        return self.kmz or self.kml
+
+    @property
+    def etiqueta(self):
+        if self.longitud_m is None:
+            return f"{self.id} · sin trazado"
+        return f"{self.id} · {self.longitud_m / 1000:.1f} km · {self.puntos:,} puntos".replace(",", ".")
+
+def partes_nombre(archivo):
+    base = os.path.splitext(archivo)[0]
+    nombre, _, id_ruta = base.rpartition("_")
+    return nombre.strip() or id_ruta.strip(), id_ruta.strip()
+
+TOLERANCIA_LONGITUD_M = 1.0  # diferencia aceptada entre el KML y el KMZ
+
+# Vacío o solo espacios/saltos de línea (hay KML de 2 bytes con "\r\n")
+def kml_vacio(kml):
+    if os.path.getsize(kml) > 1024:
+        return False
+    with open(kml, "rb") as f:
+        return not f.read().strip()
+
+def _firma_archivos(*rutas):
+    partes = []
+    for ruta in rutas:
+        if ruta:
+            info = os.stat(ruta)
+            partes.append(f"{os.path.basename(ruta)}|{info.st_mtime_ns}|{info.st_size}")
+    return ";".join(partes)
+
+# Agrupa los archivos de la carpeta en entradas (sin leerlos). Se agrupa por
+# (nombre, id); solo cuando un nombre tiene exactamente un KML y un KMZ con
+# ids distintos se juntan en una entrada con alias.
+def _entradas_sin_datos(carpeta):
+    por_nombre = {}
+    for archivo in sorted(os.listdir(carpeta)):
+        extension = os.path.splitext(archivo)[1].lower()
+        if extension not in (".kml", ".kmz"):
+            continue
+        nombre, id_ruta = partes_nombre(archivo)
+        por_nombre.setdefault(nombre, []).append((extension, id_ruta, os.path.join(carpeta, archivo)))
+
+    entradas = {}
+    for nombre, archivos in por_nombre.items():
+        extensiones = sorted(extension for extension, _, _ in archivos)
+        if extensiones == [".kml", ".kmz"] and archivos[0][1] != archivos[1][1]:
+            (id_kml, kml), (id_kmz, kmz) = [(i, r) for _, i, r in sorted(archivos)]
+            grupos = [(id_kmz, kml, kmz, (id_kml,))]
+        else:
+            por_id = {}
+            for extension, id_ruta, ruta in archivos:
+                por_id.setdefault(id_ruta, {})[extension] = ruta
+            grupos = [(i, g.get(".kml"), g.get(".kmz"), ()) for i, g in por_id.items()]
+        for id_ruta, kml, kmz, alias in grupos:
+            if id_ruta in entradas:
+                continue  # mismo id con otro nombre (S-422 en ambos sentidos): gana el primero
+            entradas[id_ruta] = EntradaRuta(id_ruta, nombre, kml, kmz, alias=alias)
+    return list(entradas.values())
+
+# Solo parsea (sin segmentar ni tocar cache_rutas): vértices y longitud
+def _medir(fuente, leer):
+    try:
+        coords = leer(fuente)
+    except Exception as e:
+        return None, str(e)
+    if len(coords) < 2:
+        return None, f"La ruta {os.path.basename(fuente)} tiene menos de dos vértices."
+    return (len(coords), float(distancia_acumulada(coords)[-1])), None
+
+# Mide ambos formatos, elige de cuál sale la geometría y solo ese pasa por el
+# almacén de rutas (se segmenta y queda en cache_rutas).
+def _completar(entrada):
+    entrada.firma = _firma_archivos(entrada.kml, entrada.kmz)
+    medida_kml = medida_kmz = error_kml = error_kmz = None
+    if entrada.kmz:
+        medida_kmz, error_kmz = _medir(entrada.kmz, leer_coordenadas_kmz)
+    if entrada.kml and not kml_vacio(entrada.kml):
+        medida_kml, error_kml = _medir(entrada.kml, leer_coordenadas_kml)
+    entrada.puntos_kml, entrada.longitud_kml_m = medida_kml or (None, None)
+    entrada.puntos_kmz, entrada.longitud_kmz_m = medida_kmz or (None, None)
+
+    entrada.error = None
+    if medida_kml is not None and medida_kmz is not None:
+        iguales = (
+            entrada.puntos_kml == entrada.puntos_kmz
+            and abs(entrada.longitud_kml_m - entrada.longitud_kmz_m) <= TOLERANCIA_LONGITUD_M
+        )
+        if iguales:
+            formato = "kml"
+        else:
+            formato = "kmz"
+            entrada.error = (
+                f"El KML ({entrada.longitud_kml_m / 1000:.1f} km, {entrada.puntos_kml} puntos) no coincide "
+                f"con el KMZ ({entrada.longitud_kmz_m / 1000:.1f} km, {entrada.puntos_kmz} puntos); se usa el KMZ."
+            )
+    elif medida_kmz is not None:
+        formato = "kmz"
+        entrada.error = error_kml
+    elif medida_kml is not None:
+        formato = "kml"
+        entrada.error = error_kmz
+    else:
+        formato = None
+        entrada.error = error_kmz or error_kml or "La ruta no tiene KML ni KMZ legibles."
+
+    entrada.formato = formato
+    entrada.puntos, entrada.longitud_m, entrada.bounds = 0, None, None
+    perdedor = {"kml": entrada.kmz, "kmz": entrada.kml}.get(formato)
+    if perdedor:
+        descartar_cache(perdedor)
+    if formato is not None:
+        try:
+            ruta = cargar_ruta(entrada.fuente)
+        except Exception as e:
+            entrada.error = str(e)
+        else:
+            # vértices del archivo, sin los puntos de corte que agrega la segmentación
+            entrada.puntos = entrada.puntos_kml if formato == "kml" else entrada.puntos_kmz
+            entrada.longitud_m, entrada.bounds = ruta.longitud_m, ruta.bounds
+    return entrada
+
+class CatalogoRutas:
+    def __init__(self, carpeta, entradas):
+        self.carpeta = carpeta
+        self.entradas = sorted(entradas, key=lambda e: e.id)
+        self._huella = None
+        self._por_id = {}
+        for entrada in self.entradas:
+            for id_ruta in entrada.alias:
+                self._por_id.setdefault(id_ruta, entrada)
+        for entrada in self.entradas:
+            self._por_id[entrada.id] = entrada
+
+    def __len__(self):
+        return len(self.entradas)
+
+    def __iter__(self):
+        return iter(self.entradas)
+
+    def __contains__(self, id_ruta):
+        return id_ruta in self._por_id
+
+    def __getitem__(self, id_ruta):
+        return self._por_id[id_ruta]
+
+    def get(self, id_ruta, defecto=None):
+        return self._por_id.get(id_ruta, defecto)
+
+    def ids(self):
+        return [entrada.id for entrada in self.entradas]
+
+    # Cambia si cambia cualquier archivo, la elección de formato o una
+    # longitud; sirve de clave para lo que se calcula sobre el catálogo
+    def huella(self):
+        if self._huella is None:
+            texto = "|".join(f"{e.id};{e.firma};{e.formato};{e.longitud_m}" for e in self.entradas)
+            self._huella = hashlib.sha1(texto.encode("utf-8")).hexdigest()[:16]
+        return self._huella
+
+# ============================
+# CACHE DEL CATÁLOGO
+# ============================
+
+_catalogos = {}   # carpeta -> (mtime de la carpeta, CatalogoRutas)
+_candado = threading.Lock()
+
+def _archivo_catalogo(carpeta):
+    return os.path.join(os.path.dirname(os.path.abspath(carpeta)), NOMBRE_CARPETA_CACHE, NOMBRE_CATALOGO)
+
+def _leer_catalogo(carpeta):
+    try:
+        with open(_archivo_catalogo(carpeta), encoding="utf-8") as f:
+            guardado = json.load(f)
+        if guardado["version"] != VERSION_CATALOGO:
+            return None, []
+        entradas = [EntradaRuta(**{**e, "alias": tuple(e["alias"])}) for e in guardado["entradas"]]
+        return guardado["mtime"], entradas
+    except (OSError, ValueError, KeyError, TypeError):
+        return None, []
+
+def _escribir_catalogo(carpeta, mtime, catalogo):
+    archivo = _archivo_catalogo(carpeta)
+    os.makedirs(os.path.dirname(archivo), exist_ok=True)
+    temporal = f"{archivo}.{os.getpid()}.{threading.get_ident()}.tmp"
+    with open(temporal, "w", encoding="utf-8") as f:
+        json.dump(
+            {"version": VERSION_CATALOGO, "mtime": mtime, "entradas": [asdict(e) for e in catalogo]},
+            f, ensure_ascii=False,
+        )
+    os.replace(temporal, archivo)
+
+# Entradas de la carpeta, reutilizando las de `previas` cuyos archivos no
+# cambiaron, y las que hay que leer de nuevo
+def _plan(carpeta, previas):
+    previas = {(e.kml, e.kmz): e for e in previas}
+    listas, pendientes = [], []
+    for entrada in _entradas_sin_datos(carpeta):
+        previa = previas.get((entrada.kml, entrada.kmz))
+        if previa is not None and previa.firma == _firma_archivos(entrada.kml, entrada.kmz):
+            listas.append(previa)
+        else:
+            pendientes.append(entrada)
+    return listas, pendientes
+
+# al_avanzar(hechos, total, id_ruta) se llama antes de leer cada ruta nueva
+def _construir(carpeta, previas, al_avanzar=None):
+    listas, pendientes = _plan(carpeta, previas)
+    for hechos, entrada in enumerate(pendientes, start=1):
+        if al_avanzar is not None:
+            al_avanzar(hechos, len(pendientes), entrada.id)
+        listas.append(_completar(entrada))
+    return CatalogoRutas(carpeta, listas)
+
+def _guardar(carpeta, mtime, catalogo):
+    try:
+        _escribir_catalogo(carpeta, mtime, catalogo)
+    except OSError:
+        pass  # sin permisos de escritura: queda solo en memoria
+    _catalogos[carpeta] = (mtime, catalogo)
+    return catalogo
+
+# El catálogo si se puede tener sin leer ninguna ruta: en memoria, en disco
+# con el mismo mtime de carpeta, o rearmado cuando solo cambió el listado y
+# no hay archivos nuevos o modificados. Si no, None (ver catalogo_rutas).
+def catalogo_disponible(carpeta):
+    carpeta = os.path.abspath(carpeta)
+    mtime = os.stat(carpeta).st_mtime_ns
+    memo = _catalogos.get(carpeta)
+    if memo is not None and memo[0] == mtime:
+        return memo[1]
+
+    with _candado:
+        memo = _catalogos.get(carpeta)
+        if memo is not None and memo[0] == mtime:
+            return memo[1]
+        mtime_guardado, previas = _leer_catalogo(carpeta)
+        if mtime_guardado == mtime:
+            catalogo = CatalogoRutas(carpeta, previas)
+            _catalogos[carpeta] = (mtime, catalogo)
+            return catalogo
+        listas, pendientes = _plan(carpeta, previas)
+        if pendientes:
+            return None
+        return _guardar(carpeta, mtime, CatalogoRutas(carpeta, listas))
+
+# Como catalogo_disponible, pero lee las rutas nuevas o modificadas si hace
+# falta (puede tardar: las páginas lo piden con catalogo_o_avance).
+def catalogo_rutas(carpeta, al_avanzar=None):
+    catalogo = catalogo_disponible(carpeta)
+    if catalogo is not None:
+        return catalogo
+    # la lectura corre sin el candado, para que las páginas que consultan
+    # catalogo_disponible no queden esperando a que termine
+    carpeta = os.path.abspath(carpeta)
+    mtime = os.stat(carpeta).st_mtime_ns
+    with _candado:
+        _, previas = _leer_catalogo(carpeta)
+    catalogo = _construir(carpeta, previas, al_avanzar)
+    with _candado:
+        return _guardar(carpeta, mtime, catalogo)
+
+# Versión para la cola de trabajos: informa el avance en el Trabajo
+def construir_catalogo(trabajo, carpeta):
+    def al_avanzar(hechos, total, id_ruta):
+        trabajo.informar((hechos - 1) / total, f"Indexando {id_ruta} ({hechos}/{total})")
+    return catalogo_rutas(carpeta, al_avanzar)
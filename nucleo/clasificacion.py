@@ -0,0 +1,69 @@
+import numpy as np
+import pandas as pd
+
+# ============================
+# CATEGORÍAS ISV
+# ============================
+# Código 0 = sin datos; 1 a 5 = CAT 1 a CAT 5 según el límite superior.
+# La clasificación trabaja sobre columnas completas: el Excel se pasa a float
+# con pd.to_numeric y los valores se ubican entre los límites con np.digitize.
+
+SIN_DATOS = 0
+COLOR_SIN_DATOS = "#FFFFFF"
+
+# (código, etiqueta, color, límite superior inclusive)
+CATEGORIAS = [
+    (1, "CAT 1 - Muy baja", "#00FF00", 1.00),
+    (2, "CAT 2 - Baja", "#FFFF00", 2.00),
+    (3, "CAT 3 - Media", "#FFA500", 3.00),
+    (4, "CAT 4 - Alta", "#FF0000", 4.00),
+    (5, "CAT 5 - Muy alta", "#808080", 5.00),
+]
+
+COLORES = {SIN_DATOS: COLOR_SIN_DATOS, **{codigo: color for codigo, _, color, _ in CATEGORIAS}}
+ETIQUETAS = {SIN_DATOS: "Sin datos", **{codigo: etiqueta for codigo, etiqueta, _, _ in CATEGORIAS}}
+
+LIMITES = np.array([limite for _, _, _, limite in CATEGORIAS], dtype=np.float64)
+NUM_CODIGOS = len(CATEGORIAS) + 1
+
+# Color por código: LUT_COLORES[codigos] da el color de cada tramo
+LUT_COLORES = np.array([COLORES[codigo] for codigo in range(NUM_CODIGOS)], dtype=object)
+
+# Columna del Excel (Series, lista o arreglo) a float64; lo que no es número
+# queda NaN.
+def columna_a_float(columna):
+    return pd.to_numeric(pd.Series(columna), errors="coerce").to_numpy(dtype=np.float64)
+
+# Código de categoría por valor. Con `n`, el resultado tiene n tramos: los
+# que no tienen valor en el Excel quedan sin datos. NaN y valores sobre el
+# último límite también quedan sin datos.
+def clasificar(valores, n=None, limites=LIMITES):
+    if valores is None:
+        return np.full(n or 0, SIN_DATOS, dtype=np.int8)
+    v = np.asarray(valores, dtype=np.float64)
+    if n is not None:
+        v = v[:n]
+        if len(v) < n:
+            v = np.concatenate((v, np.full(n - len(v), np.nan)))
+    # right=True: límite superior inclusive; índice len(limites) = fuera de rango
+    indice = np.digitize(v, limites, right=True)
+    codigos = np.where(indice < len(limites), indice + 1, SIN_DATOS)
+    codigos[np.isnan(v)] = SIN_DATOS
+    return codigos.astype(np.int8)
+
+def colores_de(codigos):
+    return LUT_COLORES[np.asarray(codigos, dtype=np.intp)]
+
+# Tramos (o metros, con `pesos`) por código de categoría, de SIN_DATOS a CAT 5.
+# Con códigos 2-D (rutas × km) da una fila por ruta, (rutas, NUM_CODIGOS), con
+# un solo bincount desplazando los códigos de cada fila.
+def histograma(codigos, pesos=None):
+    codigos = np.asarray(codigos, dtype=np.intp)
+    if codigos.ndim == 1:
+        return np.bincount(codigos, weights=pesos, minlength=NUM_CODIGOS)
+    filas = codigos.shape[0]
+    desplazados = (codigos + NUM_CODIGOS * np.arange(filas)[:, None]).ravel()
+    if pesos is not None:
+        pesos = np.broadcast_to(pesos, codigos.shape).ravel()
+    conteo = np.bincount(desplazados, weights=pesos, minlength=filas * NUM_CODIGOS)
+    return conteo.reshape(filas, NUM_CODIGOS)
@@ -0,0 +1,158 @@
+from functools import lru_cache
+
+import numpy as np
+import pandas as pd
+
+from nucleo.catalogo import catalogo_rutas
+from nucleo.clasificacion import NUM_CODIGOS, SIN_DATOS, clasificar, histograma
+from nucleo.indices_excel import cargar_indices, huella_libro
+from nucleo.regiones import REGIONES
+from nucleo.segmentacion import LARGO_TRAMO_M
+
+# ============================
+# ESTADÍSTICAS ISV POR RUTA
+# ============================
+# Cada libro de índices se ve como una matriz ruta × km. Sobre ella se
+# calculan, sin recorrer rutas ni km en Python, la distribución de
+# categorías ponderada por largo (el último km de cada ruta pesa solo lo que
+# mide), la racha más larga de km críticos y la diferencia entre dos
+# índices. Los resúmenes quedan en memoria mientras no cambien los KMZ ni el
+# libro.
+
+CATEGORIA_CRITICA = 4  # CAT 4 y CAT 5
+
+def matriz_indices(indices):
+    rutas = sorted(indices)
+    if not rutas:
+        return rutas, np.empty((0, 0), dtype=np.float32)
+    return rutas, np.vstack([indices[ruta] for ruta in rutas])
+
+# Metros de cada km que caen dentro de la ruta; sin longitud conocida (ruta
+# sin KMZ) cada km pesa un km completo.
+def pesos_km(longitudes_m, num_km):
+    inicios = np.arange(num_km) * LARGO_TRAMO_M
+    pesos = np.clip(longitudes_m[:, None] - inicios[None, :], 0.0, LARGO_TRAMO_M)
+    pesos[np.isnan(longitudes_m)] = LARGO_TRAMO_M
+    return pesos
+
+# Metros por código de categoría, (rutas, NUM_CODIGOS)
+def distribucion_categorias(codigos, pesos):
+    return histograma(codigos, pesos)
+
+def media_ponderada(valores, pesos):
+    validos = ~np.isnan(valores) & (pesos > 0)
+    suma_pesos = np.where(validos, pesos, 0.0).sum(axis=1)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        return np.where(validos, valores * pesos, 0.0).sum(axis=1) / suma_pesos
+
+# Largo (en km) e índice de inicio de la racha más larga de True en cada
+# fila; ante empate, la primera. Sin rachas: largo 0 e inicio -1.
+def racha_mas_larga(mascara):
+    filas = mascara.shape[0]
+    borde = np.zeros((filas, 1), dtype=np.int8)
+    cambios = np.diff(np.hstack((borde, mascara.astype(np.int8), borde)), axis=1)
+    fila_ini, col_ini = np.nonzero(cambios == 1)
+    _, col_fin = np.nonzero(cambios == -1)
+    largos = col_fin - col_ini
+
+    largo = np.zeros(filas, dtype=np.int64)
+    inicio = np.full(filas, -1, dtype=np.int64)
+    if len(largos):
+        # por fila, la más larga primero (lexsort es estable: empata la primera)
+        orden = np.lexsort((-largos, fila_ini))
+        filas_orden = fila_ini[orden]
+        primera = np.concatenate(([True], filas_orden[1:] != filas_orden[:-1]))
+        elegidas = orden[primera]
+        largo[fila_ini[elegidas]] = largos[elegidas]
+        inicio[fila_ini[elegidas]] = col_ini[elegidas]
+    return largo, inicio
+
+# Longitudes desde el catálogo, sin abrir los KMZ. Las rutas sin archivo o
+# con KMZ ilegible quedan en NaN y se ponderan como si no tuvieran KMZ.
+def longitudes_rutas(region, rutas):
+    catalogo = catalogo_rutas(region.carpeta_kmz)
+    longitudes = np.full(len(rutas), np.nan)
+    for i, ruta in enumerate(rutas):
+        entrada = catalogo.get(ruta)
+        if entrada is not None and entrada.longitud_m is not None:
+            longitudes[i] = entrada.longitud_m
+    return longitudes
+
+# Los caches van por clave de región (Region no es hashable) y por una huella
+# que solo depende del libro y de las rutas del catálogo (longitudes), no de
+# cómo se dibujan los mapas.
+def huella_estadisticas(region, tipo):
+    archivo_excel, hoja = region.fuente(tipo)
+    return f"{tipo}|{hoja}|{huella_libro(archivo_excel)}|{catalogo_rutas(region.carpeta_kmz).huella()}"
+
+@lru_cache(maxsize=64)
+def _datos_fuente(clave_region, tipo, huella):
+    region = REGIONES[clave_region]
+    archivo_excel, hoja = region.fuente(tipo)
+    rutas, valores = matriz_indices(cargar_indices(archivo_excel, hoja))
+    valores = valores.astype(np.float64)
+    longitudes = longitudes_rutas(region, rutas)
+    pesos = pesos_km(longitudes, valores.shape[1])
+    return rutas, valores, clasificar(valores), pesos, longitudes
+
+# (rutas, valores, códigos, pesos, longitudes) de una fuente de índices
+def datos_fuente(region, tipo):
+    return _datos_fuente(region.clave, tipo, huella_estadisticas(region, tipo))
+
+@lru_cache(maxsize=64)
+def _resumen(clave_region, tipo, huella):
+    region = REGIONES[clave_region]
+    rutas, valores, codigos, pesos, longitudes = _datos_fuente(clave_region, tipo, huella)
+    metros = distribucion_categorias(codigos, pesos)
+    con_datos = metros[:, 1:].sum(axis=1)
+    racha, inicio = racha_mas_larga((codigos >= CATEGORIA_CRITICA) & (pesos > 0))
+
+    tabla = pd.DataFrame({
+        "Región": region.nombre,
+        "Índice": tipo,
+        "Ruta": rutas,
+        "Longitud (km)": np.round(longitudes / 1000, 2),
+        "Km con datos": np.round(con_datos / 1000, 2),
+    })
+    with np.errstate(invalid="ignore", divide="ignore"):
+        for codigo in range(1, NUM_CODIGOS):
+            tabla[f"% CAT {codigo}"] = np.round(100 * metros[:, codigo] / con_datos, 1)
+    tabla["Km CAT ≥ 4"] = np.round(metros[:, CATEGORIA_CRITICA:].sum(axis=1) / 1000, 2)
+    tabla["Peor racha CAT ≥ 4 (km)"] = racha
+    tabla["Desde km"] = np.where(racha > 0, inicio + 1, 0)
+    tabla["Valor medio"] = np.round(media_ponderada(valores, pesos), 3)
+    return tabla
+
+# Una fila por ruta del libro; el DataFrame es compartido, no modificarlo.
+def resumen_indices(region, tipo):
+    return _resumen(region.clave, tipo, huella_estadisticas(region, tipo))
+
+@lru_cache(maxsize=64)
+def _diferencias(clave_region, tipo_a, tipo_b, huella_a, huella_b):
+    region = REGIONES[clave_region]
+    rutas_a, valores_a, codigos_a, pesos, _ = _datos_fuente(clave_region, tipo_a, huella_a)
+    rutas_b, valores_b, codigos_b, _, _ = _datos_fuente(clave_region, tipo_b, huella_b)
+    comunes = sorted(set(rutas_a) & set(rutas_b))
+    ia = np.searchsorted(rutas_a, comunes)
+    ib = np.searchsorted(rutas_b, comunes)
+    num_km = min(valores_a.shape[1], valores_b.shape[1])
+
+    pesos = pesos[ia, :num_km]
+    ca, cb = codigos_a[ia, :num_km], codigos_b[ib, :num_km]
+    media_a = media_ponderada(valores_a[ia, :num_km], pesos)
+    media_b = media_ponderada(valores_b[ib, :num_km], pesos)
+    cambio = (ca != cb) & ((ca != SIN_DATOS) | (cb != SIN_DATOS)) & (pesos > 0)
+
+    return pd.DataFrame({
+        "Región": region.nombre,
+        "Ruta": comunes,
+        f"Medio {tipo_a}": np.round(media_a, 3),
+        f"Medio {tipo_b}": np.round(media_b, 3),
+        "Δ": np.round(media_a - media_b, 3),
+        "Km con cambio de categoría": cambio.sum(axis=1),
+        f"Km {tipo_a} > {tipo_b}": (cambio & (ca > cb) & (cb != SIN_DATOS)).sum(axis=1),
+    })
+
+# Comparación por ruta entre dos índices de la misma región (A − B)
+def diferencias_indices(region, tipo_a, tipo_b):
+    return _diferencias(region.clave, tipo_a, tipo_b, huella_estadisticas(region, tipo_a), huella_estadisticas(region, tipo_b))
@@ -0,0 +1,102 @@
+import os
+import re
+import zipfile
+from dataclasses import dataclass
+from xml.etree import ElementTree
+
+# ============================
+# FUENTES DE ÍNDICES
+# ============================
+# Las fuentes de índices de una región se descubren en su carpeta en vez de
+# fijarse a mano. Cada descubridor recibe la carpeta y devuelve
+# {tipo: FuenteIndices}; el estándar reconoce los libros INDICES CACC_*.xlsx
+# (IMN, IRN y los escenarios IMNB-IMNE, IRNE, ...) y elige la hoja
+# normalizada de cada uno leyendo solo xl/workbook.xml. El resultado se
+# guarda mientras no cambien los libros de la carpeta.
+
+PREFIJO_LIBRO = "INDICES CACC_"
+EXTENSION_LIBRO = ".xlsx"
+
+# Solo la hoja normalizada "limpia"; las copias llevan sufijo " (2)", " (3)"
+_HOJA_NORMALIZADA = re.compile(r"^Indices (Mejorados|Reales) Normalizados$")
+
+# Familia de índice por las dos primeras letras del tipo
+FAMILIAS = {"IM": ("Mejorados", "Mejorado"), "IR": ("Reales", "Real")}
+
+_NS_HOJAS = "{http://schemas.openxmlformats.org/spreadsheetml/2006/main}"
+
+@dataclass(frozen=True)
+class FuenteIndices:
+    archivo: str   # relativo a la carpeta de la región
+    hoja: str
+    etiqueta: str = ""
+
+def hojas_libro(archivo_excel):
+    with zipfile.ZipFile(archivo_excel) as z:
+        raiz = ElementTree.fromstring(z.read("xl/workbook.xml"))
+    return [hoja.get("name") for hoja in raiz.iter(f"{_NS_HOJAS}sheet")]
+
+# Hoja normalizada del libro: la de su familia si existe, si no la única
+# normalizada que tenga (IMNB, por ejemplo, solo trae la de reales).
+def hoja_normalizada(archivo_excel, tipo):
+    candidatas = [h for h in hojas_libro(archivo_excel) if _HOJA_NORMALIZADA.match(h)]
+    familia = FAMILIAS.get(tipo[:2], ("",))[0]
+    for hoja in candidatas:
+        if familia and familia in hoja:
+            return hoja
+    return candidatas[0] if candidatas else None
+
+# "Mejorado (IMN)", "Mejorado escenario B (IMNB)"
+def etiqueta_tipo(tipo):
+    nombre = FAMILIAS.get(tipo[:2], ("", tipo))[1]
+    escenario = tipo[3:]
+    if escenario:
+        nombre = f"{nombre} escenario {escenario}"
+    return f"{nombre} ({tipo})"
+
+def descubrir_libros_cacc(carpeta):
+    fuentes = {}
+    for archivo in sorted(os.listdir(carpeta)):
+        if not (archivo.startswith(PREFIJO_LIBRO) and archivo.endswith(EXTENSION_LIBRO)):
+            continue
+        tipo = archivo[len(PREFIJO_LIBRO):-len(EXTENSION_LIBRO)]
+        try:
+            hoja = hoja_normalizada(os.path.join(carpeta, archivo), tipo)
+        except (OSError, KeyError, zipfile.BadZipFile, ElementTree.ParseError):
+            continue  # libro ilegible o abierto a medias por Excel
+        if hoja is not None:
+            fuentes[tipo] = FuenteIndices(archivo, hoja, etiqueta_tipo(tipo))
+    return fuentes
+
+DESCUBRIDORES = [descubrir_libros_cacc]
+
+def registrar_descubridor(descubridor):
+    DESCUBRIDORES.append(descubridor)
+    _fuentes.clear()
+
+# carpeta -> (firma, fuentes): solo la última firma de cada carpeta
+_fuentes = {}
+
+def _descubrir(carpeta):
+    fuentes = {}
+    for descubridor in DESCUBRIDORES:
+        fuentes.update(descubridor(carpeta))
+    return fuentes
+
+# {tipo: FuenteIndices} de la carpeta. La firma (nombre, mtime y tamaño de
+# cada archivo) hace que un libro nuevo o modificado se vuelva a revisar.
+def descubrir_fuentes(carpeta):
+    try:
+        firma = tuple(
+            (entrada.name, entrada.stat().st_mtime_ns, entrada.stat().st_size)
+            for entrada in sorted(os.scandir(carpeta), key=lambda e: e.name)
+            if entrada.is_file()
+        )
+    except FileNotFoundError:
+        return {}
+    memo = _fuentes.get(carpeta)
+    if memo is not None and memo[0] == firma:
+        return memo[1]
+    fuentes = _descubrir(carpeta)
+    _fuentes[carpeta] = (firma, fuentes)
+    return fuentes
@@ -0,0 +1,126 @@
+import numpy as np
+
+# ============================
+# PARÁMETROS
+# ============================
+
+# Elipsoide WGS84 (el mismo que usa geopy por defecto)
+WGS84_A = 6378137.0
+WGS84_F = 1 / 298.257223563
+WGS84_B = WGS84_A * (1 - WGS84_F)
+
+# Radio medio terrestre (IUGG) para el modo esférico
+RADIO_MEDIO = 6371008.8
+
+MODO_ELIPSOIDAL = "elipsoidal"
+MODO_HAVERSINE = "haversine"
+MODOS = (MODO_ELIPSOIDAL, MODO_HAVERSINE)
+MODO_POR_DEFECTO = MODO_ELIPSOIDAL
+
+# ============================
+# FUNCIONES INTERNAS
+# ============================
+
+def _como_array(coords):
+    arr = np.asarray(coords, dtype=np.float64)
+    if arr.ndim != 2 or arr.shape[1] < 2:
+        raise ValueError("Se esperaba un arreglo de coordenadas (N, 2) o (N, 3) en orden lon, lat[, ele].")
+    return arr
+
+def _haversine(lon1, lat1, lon2, lat2):
+    lon1, lat1, lon2, lat2 = (np.radians(x) for x in (lon1, lat1, lon2, lat2))
+    a = np.sin((lat2 - lat1) / 2) ** 2 + np.cos(lat1) * np.cos(lat2) * np.sin((lon2 - lon1) / 2) ** 2
+    return 2 * RADIO_MEDIO * np.arcsin(np.sqrt(np.clip(a, 0.0, 1.0)))
+
+def _vincenty(lon1, lat1, lon2, lat2, max_iter=200, tol=1e-12):
+    # Problema inverso de Vincenty resuelto para todos los pares a la vez
+    f = WGS84_F
+    L = np.radians(lon2 - lon1)
+    L = (L + np.pi) % (2 * np.pi) - np.pi
+    U1 = np.arctan((1 - f) * np.tan(np.radians(lat1)))
+    U2 = np.arctan((1 - f) * np.tan(np.radians(lat2)))
+    sin_u1, cos_u1 = np.sin(U1), np.cos(U1)
+    sin_u2, cos_u2 = np.sin(U2), np.cos(U2)
+
+    lam = L.copy()
+    convergido = np.zeros(L.shape, dtype=bool)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        for _ in range(max_iter):
+            sin_lam, cos_lam = np.sin(lam), np.cos(lam)
+            sin_sigma = np.sqrt((cos_u2 * sin_lam) ** 2 + (cos_u1 * sin_u2 - sin_u1 * cos_u2 * cos_lam) ** 2)
+            cos_sigma = sin_u1 * sin_u2 + cos_u1 * cos_u2 * cos_lam
+            sigma = np.arctan2(sin_sigma, cos_sigma)
+            sin_alpha = np.where(sin_sigma == 0, 0.0, cos_u1 * cos_u2 * sin_lam / sin_sigma)
+            cos2_alpha = 1 - sin_alpha ** 2
+            # En el ecuador cos2_alpha = 0 y cos_2sm no está definido
+            cos_2sm = np.where(cos2_alpha == 0, 0.0, cos_sigma - 2 * sin_u1 * sin_u2 / cos2_alpha)
+            C = f / 16 * cos2_alpha * (4 + f * (4 - 3 * cos2_alpha))
+            lam_anterior = lam
+            lam = L + (1 - C) * f * sin_alpha * (
+                sigma + C * sin_sigma * (cos_2sm + C * cos_sigma * (-1 + 2 * cos_2sm ** 2))
+            )
+            convergido = np.abs(lam - lam_anterior) <= tol
+            if convergido.all():
+                break
+
+    u2 = cos2_alpha * (WGS84_A ** 2 - WGS84_B ** 2) / WGS84_B ** 2
+    A = 1 + u2 / 16384 * (4096 + u2 * (-768 + u2 * (320 - 175 * u2)))
+    B = u2 / 1024 * (256 + u2 * (-128 + u2 * (74 - 47 * u2)))
+    delta_sigma = B * sin_sigma * (
+        cos_2sm + B / 4 * (
+            cos_sigma * (-1 + 2 * cos_2sm ** 2)
+            - B / 6 * cos_2sm * (-3 + 4 * sin_sigma ** 2) * (-3 + 4 * cos_2sm ** 2)
+        )
+    )
+    s = WGS84_B * A * (sigma - delta_sigma)
+
+    # Puntos casi antipodales: Vincenty no converge, se usa la aproximación esférica
+    if not convergido.all():
+        falla = ~convergido
+        s[falla] = _haversine(lon1[falla], lat1[falla], lon2[falla], lat2[falla])
+    return s
+
+# ============================
+# API
+# ============================
+
+# Longitud en metros de cada par de vértices consecutivos (N-1 valores).
+def distancias_segmentos(coords, modo=MODO_POR_DEFECTO):
+    arr = _como_array(coords)
+    if len(arr) < 2:
+        return np.zeros(0, dtype=np.float64)
+    lon1, lat1 = arr[:-1, 0], arr[:-1, 1]
+    lon2, lat2 = arr[1:, 0], arr[1:, 1]
+    if modo == MODO_ELIPSOIDAL:
+        return _vincenty(lon1, lat1, lon2, lat2)
+    if modo == MODO_HAVERSINE:
+        return _haversine(lon1, lat1, lon2, lat2)
+    raise ValueError(f"Modo geodésico desconocido: {modo!r}. Opciones: {', '.join(MODOS)}")
+
+# Distancia acumulada en metros desde el primer vértice (N valores, el primero es 0).
+def distancia_acumulada(coords, modo=MODO_POR_DEFECTO):
+    tramos = distancias_segmentos(coords, modo)
+    acumulada = np.empty(len(tramos) + 1, dtype=np.float64)
+    acumulada[0] = 0.0
+    np.cumsum(tramos, out=acumulada[1:])
+    return acumulada
+
+# Longitud total de la polilínea en metros.
+def longitud_total(coords, modo=MODO_POR_DEFECTO):
+    return float(distancias_segmentos(coords, modo).sum())
+
+# ============================
+# VERIFICACIÓN CONTRA GEOPY
+# ============================
+
+# Máxima diferencia absoluta (m) por tramo frente a geopy.distance.geodesic (Karney).
+def comparar_con_geopy(coords, modo=MODO_POR_DEFECTO):
+    from geopy.distance import geodesic
+
+    arr = _como_array(coords)
+    propias = distancias_segmentos(arr, modo)
+    referencia = np.array([
+        geodesic((arr[i - 1, 1], arr[i - 1, 0]), (arr[i, 1], arr[i, 0])).meters
+        for i in range(1, len(arr))
+    ])
+    return float(np.max(np.abs(propias - referencia))) if len(referencia) else 0.0
@@ -0,0 +1,104 @@
+import glob
+import hashlib
+import os
+
+import numpy as np
+import pandas as pd
+
+from nucleo.clasificacion import columna_a_float
+
+# ============================
+# ÍNDICES CACC DESDE EXCEL
+# ============================
+# Cada libro INDICES CACC_*.xlsx se lee una sola vez por hoja: la fila 3 trae
+# los nombres de ruta (desde la columna C) y las filas 18 a 721 los valores por
+# km. El resultado se guarda como Parquet en <proyecto>/cache_indices y se
+# invalida cuando cambia el mtime o el tamaño del libro.
+
+FILA_NOMBRES = 3
+PRIMERA_COLUMNA = 2
+PRIMERA_FILA_KM = 18
+ULTIMA_FILA_KM = 721
+
+NOMBRE_CARPETA_CACHE = "cache_indices"
+
+def leer_indices_excel(archivo_excel, hoja):
+    df = pd.read_excel(archivo_excel, sheet_name=hoja, header=None, engine='openpyxl')
+    nombres = df.iloc[FILA_NOMBRES, PRIMERA_COLUMNA:].astype(str).str.strip()
+    celdas = df.iloc[PRIMERA_FILA_KM:ULTIMA_FILA_KM + 1, PRIMERA_COLUMNA:]
+    bloque = np.empty(celdas.shape, dtype=np.float32)
+    for j in range(celdas.shape[1]):
+        bloque[:, j] = columna_a_float(celdas.iloc[:, j])
+    indices = {}
+    for j, nombre in enumerate(nombres):
+        # Igual que antes, ante nombres repetidos manda la primera columna
+        if nombre in ("", "nan") or nombre in indices:
+            continue
+        indices[nombre] = np.ascontiguousarray(bloque[:, j])
+    return indices
+
+# ============================
+# CACHE PARQUET
+# ============================
+
+def _prefijo_cache(archivo_excel, hoja):
+    carpeta = os.path.join(os.path.dirname(os.path.abspath(archivo_excel)), NOMBRE_CARPETA_CACHE)
+    nombre = hashlib.sha1(f"{os.path.abspath(archivo_excel)}|{hoja}".encode("utf-8")).hexdigest()[:20]
+    return os.path.join(carpeta, nombre)
+
+def huella_libro(archivo_excel):
+    info = os.stat(archivo_excel)
+    return hashlib.sha1(f"{info.st_mtime_ns}|{info.st_size}".encode("utf-8")).hexdigest()[:16]
+
+def _leer_parquet(archivo):
+    try:
+        df = pd.read_parquet(archivo)
+    except (OSError, ValueError, ImportError):
+        return None
+    return {str(col): df[col].to_numpy(dtype=np.float32) for col in df.columns}
+
+def _escribir_parquet(archivo, indices):
+    prefijo = archivo.rsplit("-", 1)[0]
+    os.makedirs(os.path.dirname(archivo), exist_ok=True)
+    temporal = f"{archivo}.{os.getpid()}.tmp"
+    pd.DataFrame(indices).to_parquet(temporal, index=False)
+    os.replace(temporal, archivo)
+    # Versiones anteriores del mismo libro y hoja
+    for viejo in glob.glob(glob.escape(prefijo) + "-*.parquet"):
+        if viejo != archivo:
+            os.remove(viejo)
+
+# (archivo, hoja) -> (huella, índices): una sola versión por libro y hoja en
+# memoria; al cambiar la huella se reemplaza la anterior en vez de acumularla
+_libros = {}
+
+def _cargar(archivo_excel, hoja, huella):
+    archivo = f"{_prefijo_cache(archivo_excel, hoja)}-{huella}.parquet"
+    indices = _leer_parquet(archivo) if os.path.exists(archivo) else None
+    if indices is None:
+        indices = leer_indices_excel(archivo_excel, hoja)
+        try:
+            _escribir_parquet(archivo, indices)
+        except (OSError, ValueError, ImportError):
+            pass  # sin pyarrow o sin permisos: solo queda el cache en memoria
+    for valores in indices.values():
+        valores.flags.writeable = False
+    return indices
+
+# ============================
+# API
+# ============================
+
+# Diccionario ruta -> valores por km (float32, NaN donde no hay dato).
+def cargar_indices(archivo_excel, hoja):
+    archivo_excel = os.path.abspath(archivo_excel)
+    huella = huella_libro(archivo_excel)
+    memo = _libros.get((archivo_excel, hoja))
+    if memo is not None and memo[0] == huella:
+        return memo[1]
+    indices = _cargar(archivo_excel, hoja, huella)
+    _libros[(archivo_excel, hoja)] = (huella, indices)
+    return indices
+
+def valores_ruta(archivo_excel, hoja, nombre_ruta):
+    return cargar_indices(archivo_excel, hoja).get(nombre_ruta)
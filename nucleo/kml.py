@@ -0,0 +1,146 @@
+import mmap
+import os
+import zipfile
+from xml.parsers import expat
+
+import numpy as np
+
+# ============================
+# LECTURA EN STREAMING DE <coordinates>
+# ============================
+# El XML se entrega a expat por bloques y el texto de cada <coordinates> se
+# convierte a float64 a medida que llega, sin construir el árbol del documento
+# ni tuplas por punto. La memoria queda acotada por el arreglo de salida.
+
+TAMANO_BLOQUE = 1 << 16  # bytes leídos por vuelta y texto acumulado antes de convertir
+
+_ESPACIOS = (" ", "\n", "\t", "\r")
+
+class _LectorCoordenadas:
+    def __init__(self):
+        self.dentro = False
+        self.fragmentos = []
+        self.tamano = 0
+        self.bloques = []
+        self.dimension = None
+        self.terminados = []
+
+    def inicio(self, nombre, _atributos):
+        if nombre.rsplit(" ", 1)[-1] == "coordinates":
+            self.dentro = True
+            self.fragmentos, self.tamano = [], 0
+            self.bloques, self.dimension = [], None
+
+    def fin(self, nombre):
+        if self.dentro and nombre.rsplit(" ", 1)[-1] == "coordinates":
+            self._convertir("".join(self.fragmentos))
+            self.dentro = False
+            self.fragmentos, self.tamano = [], 0
+            self.terminados.append(self._arreglo())
+
+    def texto(self, datos):
+        if not self.dentro:
+            return
+        self.fragmentos.append(datos)
+        self.tamano += len(datos)
+        if self.tamano < TAMANO_BLOQUE:
+            return
+        # Solo se convierten tuplas completas; la última puede venir cortada
+        texto = "".join(self.fragmentos)
+        corte = max(texto.rfind(c) for c in _ESPACIOS)
+        if corte <= 0:
+            self.fragmentos, self.tamano = [texto], len(texto)
+            return
+        self._convertir(texto[:corte])
+        resto = texto[corte:]
+        self.fragmentos, self.tamano = [resto], len(resto)
+
+    def _convertir(self, texto):
+        texto = texto.strip()
+        if not texto:
+            return
+        if self.dimension is None:
+            self.dimension = texto.split(None, 1)[0].count(",") + 1
+        valores = np.fromstring(texto.replace(",", " "), dtype=np.float64, sep=" ")
+        if self.dimension in (2, 3) and valores.size % self.dimension == 0:
+            bloque = valores.reshape(-1, self.dimension)
+        else:
+            bloque = self._convertir_tupla_a_tupla(texto)
+        if bloque.shape[1] == 2:
+            bloque = np.column_stack([bloque, np.zeros(len(bloque))])
+        self.bloques.append(bloque)
+
+    @staticmethod
+    def _convertir_tupla_a_tupla(texto):
+        # Respaldo para documentos que mezclan tuplas lon,lat y lon,lat,ele
+        filas = []
+        for tupla in texto.split():
+            partes = tupla.split(",")
+            if len(partes) >= 2:
+                ele = float(partes[2]) if len(partes) >= 3 else 0.0
+                filas.append((float(partes[0]), float(partes[1]), ele))
+        return np.array(filas, dtype=np.float64).reshape(-1, 3)
+
+    def _arreglo(self):
+        if not self.bloques:
+            return np.empty((0, 3), dtype=np.float64)
+        arreglo = self.bloques[0] if len(self.bloques) == 1 else np.concatenate(self.bloques)
+        self.bloques = []
+        return np.ascontiguousarray(arreglo[:, :3])
+
+def _nuevo_parser(lector):
+    parser = expat.ParserCreate(namespace_separator=" ")
+    parser.buffer_text = True
+    parser.buffer_size = TAMANO_BLOQUE
+    parser.StartElementHandler = lector.inicio
+    parser.EndElementHandler = lector.fin
+    parser.CharacterDataHandler = lector.texto
+    return parser
+
+# ============================
+# API
+# ============================
+
+# Recorre cada elemento <coordinates> de un KML (ruta o archivo binario abierto)
+# y entrega un arreglo float64 (N, 3) lon, lat, ele por elemento.
+def iterar_coordenadas(fuente):
+    if isinstance(fuente, (str, bytes)) or hasattr(fuente, "__fspath__"):
+        with open(fuente, "rb") as archivo:
+            yield from iterar_coordenadas(archivo)
+        return
+
+    lector = _LectorCoordenadas()
+    parser = _nuevo_parser(lector)
+    while True:
+        bloque = fuente.read(TAMANO_BLOQUE)
+        parser.Parse(bloque, not bloque)
+        if lector.terminados:
+            yield from lector.terminados
+            lector.terminados = []
+        if not bloque:
+            break
+
+# Coordenadas del primer <coordinates> del documento (igual que root.find).
+def leer_coordenadas(fuente):
+    for coords in iterar_coordenadas(fuente):
+        return coords
+    raise ValueError("El documento KML no contiene elementos <coordinates>.")
+
+def abrir_kml_de_kmz(kmz):
+    kml_file = next(f for f in kmz.namelist() if f.endswith('.kml'))
+    return kmz.open(kml_file)
+
+# El KML plano se lee a través de un mmap: expat recibe los bloques
+# directamente de las páginas del archivo, sin buffer intermedio de Python ni
+# inflado como en el KMZ.
+def leer_coordenadas_kml(kml_path):
+    with open(kml_path, "rb") as archivo:
+        if os.fstat(archivo.fileno()).st_size == 0:
+            raise ValueError(f"El archivo {os.path.basename(kml_path)} está vacío.")
+        with mmap.mmap(archivo.fileno(), 0, access=mmap.ACCESS_READ) as mapa:
+            return leer_coordenadas(mapa)
+
+def leer_coordenadas_kmz(kmz_path):
+    with zipfile.ZipFile(kmz_path, 'r') as z:
+        with abrir_kml_de_kmz(z) as kml:
+            return leer_coordenadas(kml)
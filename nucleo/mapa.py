@@ -0,0 +1,147 @@
+import folium
+import numpy as np
+from folium.plugins import FastMarkerCluster
+
+from nucleo.clasificacion import CATEGORIAS, COLOR_SIN_DATOS, ETIQUETAS, SIN_DATOS, colores_de
+
+# ============================
+# CAPAS DE TRAMOS PARA FOLIUM
+# ============================
+# Todos los tramos de una ruta viajan al navegador como una sola
+# FeatureCollection (la categoría y el color van como propiedades), con un
+# único contorno negro debajo. Las etiquetas de km se dibujan desde un solo
+# arreglo JS con FastMarkerCluster en vez de un Marker + DivIcon por tramo.
+
+# Se evalúa en el navegador para cada fila [lat, lon, color, número]
+_ICONO_KM_JS = """
+function (fila) {
+    var html = '<div style="background-color: ' + fila[2] + '; color: black;' +
+        ' border-radius: 50%; width: 32px; height: 32px;' +
+        ' display: flex; align-items: center; justify-content: center;' +
+        ' font-weight: bold; font-size: 13px;' +
+        ' border: 2px solid #00000088;' +
+        ' box-shadow: 1px 1px 6px rgba(0,0,0,0.5);">' + fila[3] + '</div>';
+    var icono = L.divIcon({html: html, className: 'empty'});
+    return L.marker(new L.LatLng(fila[0], fila[1]), {icon: icono});
+}
+"""
+
+# Leyenda de categorías (HTML para st.markdown), armada desde CATEGORIAS para
+# que los colores y límites sean los mismos que usa clasificar
+def leyenda_html():
+    muestra = "<span style='background-color:{};padding:5px 10px;margin-right:5px;{}'></span> {}<br>"
+    filas = [muestra.format(color, "", f"{etiqueta} (≤ {limite:.2f})") for _, etiqueta, color, limite in CATEGORIAS]
+    filas.append(muestra.format(COLOR_SIN_DATOS, "border:1px solid #ccc;", ETIQUETAS[SIN_DATOS]))
+    return "<div style='line-height: 2'>" + "".join(filas) + "</div>"
+
+# Un Feature por tramo, numerados desde 1 dentro de la ruta
+def coleccion_tramos(segmentos, categorias):
+    colores = colores_de(categorias).tolist()
+    return {
+        "type": "FeatureCollection",
+        "features": [
+            {
+                "type": "Feature",
+                "properties": {"tramo": numero, "categoria": int(categoria), "color": color},
+                "geometry": {"type": "LineString", "coordinates": seg.tolist()},
+            }
+            for numero, (seg, categoria, color) in enumerate(zip(segmentos, categorias, colores), start=1)
+        ],
+    }
+
+# Una fila por tramo: posición de la etiqueta (desplazada como antes respecto
+# del primer vértice), color de la categoría y número de tramo. Las
+# posiciones salen de una sola operación sobre la RutaSegmentada. Con
+# `mascara`, solo los tramos marcados.
+def filas_etiquetas_km(segmentos, categorias, mascara=None):
+    primeros, segundos = segmentos.primeros_lados()
+    etiquetas = primeros + (segundos - primeros) * 0.03
+    etiquetas[:, 1] -= 0.0020
+    filas = [
+        [lat, lon, color, i + 1]
+        for i, ((lon, lat), color) in enumerate(zip(etiquetas.tolist(), colores_de(categorias).tolist()))
+    ]
+    if mascara is not None:
+        filas = [fila for fila, marcada in zip(filas, np.asarray(mascara).tolist()) if marcada]
+    return filas
+
+def agregar_tramos(m, segmentos, categorias, contorno=True, etiquetas=True, peso=5):
+    if len(segmentos) == 0:
+        return
+    agregar_coleccion(m, coleccion_tramos(segmentos, categorias), contorno, peso)
+    if etiquetas:
+        FastMarkerCluster(
+            filas_etiquetas_km(segmentos, categorias),
+            callback=_ICONO_KM_JS,
+            name="Km",
+            disableClusteringAtZoom=13,
+        ).add_to(m)
+
+# Agrega una FeatureCollection ya armada (por ejemplo, la capa global
+# precalculada). Si los tramos traen la propiedad "ruta", va en el tooltip;
+# `tooltip` [(campo, alias), ...] lo reemplaza.
+def agregar_coleccion(m, coleccion, contorno=True, peso=5, tooltip=None):
+    if not coleccion["features"]:
+        return
+    if tooltip is None:
+        tooltip = [("tramo", "Tramo")]
+        if "ruta" in coleccion["features"][0]["properties"]:
+            tooltip = [("ruta", "Ruta")] + tooltip
+    campos = [campo for campo, _ in tooltip]
+    alias = [nombre for _, nombre in tooltip]
+    if contorno:
+        folium.GeoJson(
+            coleccion,
+            name="Contorno",
+            control=False,
+            style_function=lambda x: {"color": "black", "weight": peso + 4},
+        ).add_to(m)
+    folium.GeoJson(
+        coleccion,
+        name="Tramos ISV",
+        style_function=lambda x: {"color": x["properties"]["color"], "weight": peso},
+        tooltip=folium.GeoJsonTooltip(fields=campos, aliases=alias),
+    ).add_to(m)
+
+# ============================
+# CAPA DE DIFERENCIAS
+# ============================
+# Misma geometría coloreada según cómo cambia la categoría de cada km entre
+# dos índices (A -> B). Las etiquetas de km se ponen solo donde cambió.
+
+COLOR_IGUAL = "#BDBDBD"
+COLOR_EMPEORA = "#D00000"
+COLOR_MEJORA = "#0070FF"
+COLOR_DATO_FALTANTE = "#FF00FF"  # uno de los dos índices no tiene valor
+
+def colores_diferencia(categorias_a, categorias_b):
+    a = np.asarray(categorias_a)
+    b = np.asarray(categorias_b)
+    con_datos = (a != SIN_DATOS) & (b != SIN_DATOS)
+    colores = np.full(len(a), COLOR_IGUAL, dtype=object)
+    colores[(a != b) & ~con_datos] = COLOR_DATO_FALTANTE
+    colores[con_datos & (b > a)] = COLOR_EMPEORA
+    colores[con_datos & (b < a)] = COLOR_MEJORA
+    return colores
+
+def agregar_diferencias(m, segmentos, categorias_a, categorias_b, peso=5):
+    if len(segmentos) == 0:
+        return
+    coleccion = coleccion_tramos(segmentos, categorias_b)
+    colores = colores_diferencia(categorias_a, categorias_b).tolist()
+    for feature, a, b, color in zip(
+        coleccion["features"], np.asarray(categorias_a).tolist(), np.asarray(categorias_b).tolist(), colores
+    ):
+        feature["properties"].update({"color": color, "antes": ETIQUETAS[a], "despues": ETIQUETAS[b]})
+    agregar_coleccion(
+        m, coleccion, contorno=True, peso=peso,
+        tooltip=[("tramo", "Tramo"), ("antes", "A"), ("despues", "B")],
+    )
+    cambio = np.asarray(categorias_a) != np.asarray(categorias_b)
+    if cambio.any():
+        FastMarkerCluster(
+            filas_etiquetas_km(segmentos, categorias_b, mascara=cambio),
+            callback=_ICONO_KM_JS,
+            name="Km con cambio",
+            disableClusteringAtZoom=13,
+        ).add_to(m)
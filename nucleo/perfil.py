@@ -0,0 +1,83 @@
+from dataclasses import dataclass
+
+import numpy as np
+
+# ============================
+# PERFIL DE ELEVACIÓN
+# ============================
+# El gráfico del perfil usa a lo más MAX_PUNTOS_GRAFICO puntos elegidos con
+# LTTB (Largest-Triangle-Three-Buckets), que conserva la forma (picos y
+# valles) mucho mejor que tomar uno de cada n. Las métricas (pendiente por
+# km, ascenso y descenso acumulados) se calculan sobre el trazado completo.
+
+MAX_PUNTOS_GRAFICO = 2000
+UMBRAL_PENDIENTE = 6.0  # % de pendiente media del km para marcarlo como empinado
+
+@dataclass
+class PerfilElevacion:
+    distancia: np.ndarray     # metros, puntos del gráfico
+    elevacion: np.ndarray     # metros, puntos del gráfico
+    pendientes: np.ndarray    # % por km (positiva = subida en el sentido de la ruta)
+    ascenso_m: float
+    descenso_m: float
+    elev_min: float
+    elev_max: float
+
+    # Números de km (desde 1) con pendiente media de al menos `umbral` (en
+    # valor absoluto)
+    def km_empinados(self, umbral=UMBRAL_PENDIENTE):
+        return np.flatnonzero(np.abs(self.pendientes) >= umbral) + 1
+
+# Índices de los `n` puntos que elige LTTB; siempre incluye el primero y el
+# último. Con n >= len(x) devuelve todos.
+def lttb(x, y, n):
+    total = len(x)
+    if n >= total or n < 3:
+        return np.arange(total)
+
+    # n - 2 cubetas entre el primer y el último punto
+    bordes = np.linspace(1, total - 1, n - 1).astype(np.int64)
+    elegidos = np.empty(n, dtype=np.int64)
+    elegidos[0] = 0
+    elegidos[-1] = total - 1
+    a = 0
+    for i in range(n - 2):
+        ini, fin = bordes[i], bordes[i + 1]
+        # promedio de la cubeta siguiente (o el último punto)
+        sig_ini, sig_fin = fin, bordes[i + 2] if i + 2 < len(bordes) else total
+        cx = x[sig_ini:sig_fin].mean()
+        cy = y[sig_ini:sig_fin].mean()
+        # área del triángulo (a, candidato, promedio siguiente), sin el 1/2
+        areas = np.abs(
+            (x[a] - cx) * (y[ini:fin] - y[a]) - (x[a] - x[ini:fin]) * (cy - y[a])
+        )
+        a = ini + int(np.argmax(areas))
+        elegidos[i + 1] = a
+    return elegidos
+
+# Pendiente media (%) de cada tramo entre cortes consecutivos
+def pendientes_por_tramo(dist_acum, elevacion, cortes):
+    inicio, fin = cortes[:-1], cortes[1:]
+    largo = dist_acum[fin] - dist_acum[inicio]
+    with np.errstate(invalid="ignore", divide="ignore"):
+        pendientes = 100.0 * (elevacion[fin] - elevacion[inicio]) / largo
+    return np.nan_to_num(pendientes)
+
+def ascenso_descenso(elevacion):
+    delta = np.diff(elevacion)
+    return float(delta[delta > 0].sum()), float(-delta[delta < 0].sum())
+
+def perfil_elevacion(ruta, max_puntos=MAX_PUNTOS_GRAFICO):
+    elevacion = np.asarray(ruta.coords[:, 2], dtype=np.float64)
+    dist_acum = np.asarray(ruta.dist_acum, dtype=np.float64)
+    elegidos = lttb(dist_acum, elevacion, max_puntos)
+    ascenso, descenso = ascenso_descenso(elevacion)
+    return PerfilElevacion(
+        distancia=dist_acum[elegidos],
+        elevacion=np.round(elevacion[elegidos], 2),
+        pendientes=pendientes_por_tramo(dist_acum, elevacion, ruta.cortes),
+        ascenso_m=ascenso,
+        descenso_m=descenso,
+        elev_min=round(float(elevacion.min()), 2),
+        elev_max=round(float(elevacion.max()), 2),
+    )
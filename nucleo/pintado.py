@@ -0,0 +1,160 @@
+import glob
+import io
+import multiprocessing
+import os
+import zipfile
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import dataclass
+from itertools import groupby
+
+from nucleo.almacen_rutas import cargar_ruta
+from nucleo.clasificacion import COLORES, ETIQUETAS, SIN_DATOS, clasificar
+
+# ============================
+# PINTADO DE KMZ POR ISV
+# ============================
+# Cada ruta se pinta en un proceso aparte: lectura (vía almacén de rutas) y
+# escritura del KMZ. El hilo de Streamlit solo reparte el trabajo y recibe el
+# avance a medida que termina cada ruta.
+
+NIVEL_PINTADO = 16  # nivel de simplificación (zoom) con que se exporta
+
+@dataclass
+class TrabajoPintado:
+    nombre: str          # nombre del archivo sin extensión
+    ruta_fuente: str     # KML o KMZ de donde se lee la geometría
+    valores: object      # valores ISV por km (o None si la ruta no está en el Excel)
+    carpeta_salida: str
+    agrupar: bool = False  # una sola línea por racha de tramos de igual categoría
+
+def kml_color(html_color):
+    html_color = html_color.lstrip('#')
+    if len(html_color) != 6:
+        return "ff000000"
+    r = html_color[0:2]
+    g = html_color[2:4]
+    b = html_color[4:6]
+    return f"ff{b}{g}{r}"
+
+def id_estilo(categoria):
+    return "sin_datos" if categoria == SIN_DATOS else f"cat{categoria}"
+
+# ============================
+# ESCRITURA DEL KML
+# ============================
+# El documento se escribe por partes directamente en la entrada doc.kml del
+# KMZ: no se arma un árbol en memoria ni se pasa por un .kml temporal en disco.
+# Los estilos de las cinco categorías y "sin datos" se definen una vez al
+# inicio y los tramos los referencian con <styleUrl>. Con agrupar=True los
+# tramos consecutivos de igual categoría van en un solo Placemark con una
+# sola LineString: los tramos seguidos comparten el vértice de corte, así que
+# la racha es un solo tramo de coords sin vértices repetidos.
+
+def _escribir_coordenadas(destino, seg):
+    destino.write('<LineString><tessellate>1</tessellate><coordinates>')
+    destino.write(" ".join([f"{lon},{lat},0" for lon, lat in seg.tolist()]))
+    destino.write('</coordinates></LineString>')
+
+def escribir_kml_pintado(destino, segmentos, categorias, agrupar=False):
+    destino.write('<?xml version="1.0" encoding="utf-8"?>\n')
+    destino.write('<kml xmlns="http://www.opengis.net/kml/2.2"><Document>\n')
+
+    for categoria in sorted(COLORES):
+        destino.write(
+            f'<Style id="{id_estilo(categoria)}"><LineStyle>'
+            f'<color>{kml_color(COLORES[categoria])}</color><width>4</width>'
+            f'</LineStyle></Style>\n'
+        )
+
+    if not agrupar:
+        for i, (seg, categoria) in enumerate(zip(segmentos, categorias)):
+            destino.write(f'<Placemark><name>Tramo {i+1}</name><styleUrl>#{id_estilo(categoria)}</styleUrl>')
+            _escribir_coordenadas(destino, seg)
+            destino.write('</Placemark>\n')
+    else:
+        for categoria, grupo in groupby(enumerate(categorias), key=lambda par: par[1]):
+            indices = [i for i, _ in grupo]
+            if len(indices) == 1:
+                nombre = f"Tramo {indices[0]+1}"
+            else:
+                nombre = f"Tramos {indices[0]+1}-{indices[-1]+1}"
+            destino.write(
+                f'<Placemark><name>{nombre} ({ETIQUETAS[categoria]})</name>'
+                f'<styleUrl>#{id_estilo(categoria)}</styleUrl>'
+            )
+            inicio, fin = segmentos.cortes[indices[0]], segmentos.cortes[indices[-1] + 1]
+            _escribir_coordenadas(destino, segmentos.coords[inicio:fin + 1, :2])
+            destino.write('</Placemark>\n')
+
+    destino.write('</Document></kml>\n')
+
+# El KMZ se arma con un nombre temporal en la misma carpeta y se renombra al
+# final: si el proceso muere a mitad de ruta no queda un _pintado.kmz cortado.
+def guardar_kmz_pintado(kmz_out, segmentos, categorias, agrupar=False):
+    temporal = f"{kmz_out}.{os.getpid()}.tmp"
+    try:
+        with zipfile.ZipFile(temporal, 'w', zipfile.ZIP_DEFLATED) as zf:
+            with zf.open("doc.kml", "w") as entrada:
+                with io.TextIOWrapper(entrada, encoding="utf-8") as destino:
+                    escribir_kml_pintado(destino, segmentos, categorias, agrupar)
+        os.replace(temporal, kmz_out)
+    except BaseException:
+        try:
+            os.remove(temporal)
+        except OSError:
+            pass
+        raise
+
+# Temporales que dejó un proceso muerto a mitad de un guardado (el except de
+# arriba no corre si lo matan con SIGKILL). Se llama al abrir la página, antes
+# de que este proceso lance ningún lote; un lote de otro proceso que esté
+# escribiendo en la misma carpeta en ese momento perdería su temporal.
+def limpiar_temporales(carpeta_salida):
+    borrados = 0
+    for temporal in glob.glob(os.path.join(glob.escape(carpeta_salida), "*_pintado.kmz.*.tmp")):
+        try:
+            os.remove(temporal)
+            borrados += 1
+        except OSError:
+            pass
+    return borrados
+
+# Se ejecuta en el proceso trabajador; devuelve la ruta del KMZ generado. La
+# geometría sale del nivel NIVEL_PINTADO del almacén (medio píxel a zoom 16,
+# ~1 m): en Google Earth no se distingue del original y pesa una fracción.
+def pintar_ruta(trabajo):
+    segmentos = cargar_ruta(trabajo.ruta_fuente).segmentos(NIVEL_PINTADO)
+    categorias = clasificar(trabajo.valores, len(segmentos)).tolist()
+
+    kmz_out = os.path.join(trabajo.carpeta_salida, f"{trabajo.nombre}_pintado.kmz")
+    guardar_kmz_pintado(kmz_out, segmentos, categorias, trabajo.agrupar)
+    return kmz_out
+
+# Reparte los trabajos en un pool de procesos del tamaño de la máquina. Una
+# ruta que falla no detiene el lote: su error se devuelve en `fallas`.
+# al_avanzar(hechos, total, trabajo, kmz_out, error) se llama en el hilo que
+# invoca esta función cada vez que termina una ruta.
+def pintar_rutas(trabajos, max_procesos=None, al_avanzar=None):
+    generados, fallas = [], []
+    if not trabajos:
+        return generados, fallas
+
+    max_procesos = max_procesos or os.cpu_count() or 1
+    # "spawn": esto corre en un hilo de la cola dentro del servidor de
+    # Streamlit, y hacer fork de un proceso con hilos puede dejar a los hijos
+    # bloqueados en un candado que tenía otro hilo.
+    contexto = multiprocessing.get_context("spawn")
+    with ProcessPoolExecutor(max_workers=min(max_procesos, len(trabajos)), mp_context=contexto) as pool:
+        futuros = {pool.submit(pintar_ruta, trabajo): trabajo for trabajo in trabajos}
+        for hechos, futuro in enumerate(as_completed(futuros), start=1):
+            trabajo = futuros[futuro]
+            kmz_out, error = None, None
+            try:
+                kmz_out = futuro.result()
+                generados.append((trabajo.nombre, kmz_out))
+            except Exception as e:
+                error = e
+                fallas.append((trabajo.nombre, repr(e)))
+            if al_avanzar is not None:
+                al_avanzar(hechos, len(trabajos), trabajo, kmz_out, error)
+    return generados, fallas
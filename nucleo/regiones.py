@@ -0,0 +1,51 @@
+import os
+from dataclasses import dataclass
+
+from nucleo.fuentes_indices import descubrir_fuentes
+
+# ============================
+# REGISTRO DE REGIONES
+# ============================
+# Cada región tiene su carpeta con los KMZ/KML (tus_kmz), sus libros de
+# índices CACC (descubiertos en la carpeta, ver fuentes_indices) y la carpeta
+# de salida de los KMZ pintados. Todas se sirven desde la misma app, así que
+# los caches de rutas e índices se comparten en un solo proceso.
+
+RAIZ_PROYECTO = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+INDICE_MEJORADO = "IMN"
+INDICE_REAL = "IRN"
+
+@dataclass
+class Region:
+    clave: str
+    nombre: str
+    carpeta: str
+
+    # tipo de índice -> FuenteIndices
+    @property
+    def indices(self):
+        return descubrir_fuentes(self.carpeta)
+
+    @property
+    def carpeta_kmz(self):
+        return os.path.join(self.carpeta, "tus_kmz")
+
+    @property
+    def carpeta_salida(self):
+        return os.path.join(self.carpeta, "kmz_pintados")
+
+    # (ruta absoluta del libro, hoja) para el tipo de índice pedido
+    def fuente(self, tipo):
+        fuente = self.indices[tipo]
+        return os.path.join(self.carpeta, fuente.archivo), fuente.hoja
+
+    # Tipos de la misma familia que `tipo` (IMN -> IMN, IMNB, ...), con el
+    # propio tipo primero
+    def escenarios(self, tipo):
+        return sorted((t for t in self.indices if t[:2] == tipo[:2]), key=lambda t: (t != tipo, t))
+
+REGIONES = {
+    "norte": Region("norte", "Norte", os.path.join(RAIZ_PROYECTO, "norte")),
+    "sur": Region("sur", "Sur", os.path.join(RAIZ_PROYECTO, "sur")),
+}
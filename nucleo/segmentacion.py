@@ -0,0 +1,72 @@
+import numpy as np
+
+# ============================
+# SEGMENTACIÓN POR KM
+# ============================
+# Los cortes caen en múltiplos exactos de LARGO_TRAMO_M a lo largo de la
+# ruta: cada marca se ubica con np.searchsorted sobre la distancia acumulada
+# y, si no coincide con un vértice, se interpola un vértice nuevo sobre el
+# lado que la contiene. Así el km i del trazado es exactamente el tramo entre
+# i * 1000 m y (i + 1) * 1000 m, sin la deriva que acumulaba cortar en el
+# primer vértice que superaba el largo.
+
+LARGO_TRAMO_M = 1000.0
+
+# Devuelve (coords, dist_acum, cortes) sobre un solo arreglo de vértices: los
+# originales más los puntos de corte interpolados. `cortes` son los índices
+# de inicio/fin de cada tramo, del primer al último vértice.
+def segmentar_por_km(coords, dist_acum, largo=LARGO_TRAMO_M):
+    total = float(dist_acum[-1]) if len(dist_acum) else 0.0
+    marcas = np.arange(largo, total, largo)
+
+    # Lado (j-1, j) que contiene cada marca: dist[j-1] < marca <= dist[j]
+    j = np.searchsorted(dist_acum, marcas, side="left")
+    nuevas = dist_acum[j] != marcas
+    j, marcas_nuevas = j[nuevas], marcas[nuevas]
+
+    d0, d1 = dist_acum[j - 1], dist_acum[j]
+    t = ((marcas_nuevas - d0) / (d1 - d0))[:, None]
+    puntos = coords[j - 1] + t * (coords[j] - coords[j - 1])
+
+    coords = np.insert(coords, j, puntos, axis=0)
+    dist_acum = np.insert(dist_acum, j, marcas_nuevas)
+
+    cortes = np.concatenate((
+        [0],
+        np.searchsorted(dist_acum, marcas, side="left"),
+        [len(dist_acum) - 1],
+    )).astype(np.int64)
+    return coords, dist_acum, cortes
+
+# ============================
+# RUTA SEGMENTADA
+# ============================
+# Un arreglo (N, 2+) de vértices y los índices de corte; cada tramo es una
+# vista coords[a:b + 1], sin copiar coordenadas ni crear un objeto por km.
+# Los tramos consecutivos comparten el vértice de corte.
+
+class RutaSegmentada:
+    __slots__ = ("coords", "cortes")
+
+    def __init__(self, coords, cortes):
+        self.coords = coords
+        self.cortes = np.asarray(cortes, dtype=np.int64)
+
+    def __len__(self):
+        return max(len(self.cortes) - 1, 0)
+
+    def __getitem__(self, i):
+        if i < 0:
+            i += len(self)
+        if not 0 <= i < len(self):
+            raise IndexError(i)
+        return self.coords[self.cortes[i]:self.cortes[i + 1] + 1, :2]
+
+    def __iter__(self):
+        for a, b in zip(self.cortes[:-1].tolist(), self.cortes[1:].tolist()):
+            yield self.coords[a:b + 1, :2]
+
+    # Primer y segundo vértice (lon, lat) de cada tramo, como arreglos (K, 2)
+    def primeros_lados(self):
+        inicios = self.cortes[:-1]
+        return self.coords[inicios, :2], self.coords[inicios + 1, :2]
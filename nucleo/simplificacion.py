@@ -0,0 +1,118 @@
+import math
+
+import numpy as np
+
+# ============================
+# SIMPLIFICACIÓN PARA VISUALIZACIÓN
+# ============================
+# Los trazados vienen de GPX con vértices cada pocos centímetros; para el mapa
+# basta con una fracción. Se precalcula Douglas-Peucker a varios niveles, uno
+# por zoom de Leaflet, con tolerancia de medio píxel en ese zoom. Los cortes
+# de km se fuerzan como vértices, así cada tramo conserva sus extremos exactos.
+
+ZOOMS_NIVELES = (8, 10, 12, 14, 16)
+ZOOM_MAXIMO_SIMPLIFICADO = 17  # más cerca que esto se usa el trazado original
+NIVEL_GLOBAL = 10  # mapas con todas las rutas de una región: se ven a zoom 6-8
+
+def tolerancia_para_zoom(zoom):
+    # grados por píxel en el zoom (teselas de 256 px), a la mitad
+    return 0.5 * 360.0 / (256 * 2 ** zoom)
+
+# Índices (ordenados) de los vértices que sobreviven a Douglas-Peucker con la
+# tolerancia dada (en grados). Los índices de `fijos` siempre se mantienen y
+# el algoritmo corre de forma independiente entre cada par consecutivo.
+def indices_simplificados(xy, tolerancia, fijos=None):
+    n = len(xy)
+    if n <= 2:
+        return np.arange(n, dtype=np.int64)
+    if fijos is None or len(fijos) == 0:
+        fijos = np.array([0, n - 1], dtype=np.int64)
+    mantener = np.zeros(n, dtype=bool)
+    mantener[fijos] = True
+    mantener[0] = mantener[-1] = True
+
+    pila = list(zip(fijos[:-1].tolist(), fijos[1:].tolist()))
+    while pila:
+        i, j = pila.pop()
+        if j - i < 2:
+            continue
+        p = xy[i]
+        d = xy[j] - p
+        interior = xy[i + 1:j] - p
+        norma = math.hypot(d[0], d[1])
+        if norma == 0.0:
+            dist = np.hypot(interior[:, 0], interior[:, 1])
+        else:
+            dist = np.abs(d[0] * interior[:, 1] - d[1] * interior[:, 0]) / norma
+        k = int(np.argmax(dist))
+        if dist[k] > tolerancia:
+            k += i + 1
+            mantener[k] = True
+            pila.append((i, k))
+            pila.append((k, j))
+    return np.flatnonzero(mantener)
+
+# Un arreglo de índices por zoom de ZOOMS_NIVELES. Cada nivel se calcula sobre
+# el resultado del anterior (más fino), lo que abarata los niveles gruesos.
+def niveles_simplificados(coords, cortes):
+    xy = coords[:, :2]
+    niveles = {}
+    base = np.arange(len(xy), dtype=np.int64)
+    for zoom in sorted(ZOOMS_NIVELES, reverse=True):
+        fijos = np.searchsorted(base, cortes)
+        base = base[indices_simplificados(xy[base], tolerancia_para_zoom(zoom), fijos)]
+        niveles[zoom] = base
+    return niveles
+
+# Nivel a usar para un zoom: el más grueso que no se nota a ese zoom, o None
+# (trazado completo) si el zoom supera al del nivel más fino.
+def nivel_para_zoom(zoom):
+    if zoom is None or zoom > ZOOM_MAXIMO_SIMPLIFICADO:
+        return None
+    for nivel in sorted(ZOOMS_NIVELES):
+        if nivel >= zoom:
+            return nivel
+    return max(ZOOMS_NIVELES)
+
+# Zoom aproximado con el que fit_bounds encuadra `bounds` en un mapa del
+# tamaño dado.
+def zoom_para_bounds(bounds, ancho_px=1000, alto_px=650):
+    (lat_min, lon_min), (lat_max, lon_max) = bounds
+    ext_lon = max(lon_max - lon_min, 1e-9)
+    ext_lat = max(lat_max - lat_min, 1e-9) / max(math.cos(math.radians((lat_min + lat_max) / 2)), 1e-6)
+    zoom_lon = math.log2(360.0 * ancho_px / (256 * ext_lon))
+    zoom_lat = math.log2(360.0 * alto_px / (256 * ext_lat))
+    return max(0, int(math.floor(min(zoom_lon, zoom_lat))))
+
+def nivel_para_bounds(bounds, ancho_px=1000, alto_px=650):
+    return nivel_para_zoom(zoom_para_bounds(bounds, ancho_px, alto_px))
+
+# Opciones de detalle que ofrecen las páginas de mapa. "Alto" equivale a
+# acercarse cuatro niveles de zoom respecto del encuadre inicial.
+DETALLE_AUTOMATICO = "Automático"
+DETALLE_ALTO = "Alto"
+DETALLE_ORIGINAL = "Original"
+DETALLES = (DETALLE_AUTOMATICO, DETALLE_ALTO, DETALLE_ORIGINAL)
+
+def nivel_para_detalle(detalle, bounds):
+    if detalle == DETALLE_ORIGINAL:
+        return None
+    zoom = zoom_para_bounds(bounds)
+    if detalle == DETALLE_ALTO:
+        zoom += 4
+    return nivel_para_zoom(zoom)
+
+if __name__ == "__main__":
+    # Vértices conservados por nivel para los KML/KMZ dados:
+    #   python -m nucleo.simplificacion norte/tus_kmz/*.kmz
+    import sys
+    from nucleo.almacen_rutas import procesar_ruta
+
+    for archivo in sys.argv[1:]:
+        ruta = procesar_ruta(archivo)
+        total = len(ruta.coords)
+        resumen = ", ".join(
+            f"z{zoom}: {len(indices)} ({100 * len(indices) / total:.1f}%)"
+            for zoom, indices in sorted(ruta.simplificados.items())
+        )
+        print(f"{archivo}: {total} vértices -> {resumen}")
@@ -0,0 +1,134 @@
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+
+# ============================
+# COLA DE TRABAJOS EN SEGUNDO PLANO
+# ============================
+# El trabajo pesado (segmentar una ruta, pintar una región, armar una capa
+# global) corre en hilos propios del proceso y no en el hilo del script de
+# Streamlit. Un rerun solo interrumpe al script: el trabajo sigue, y como cada
+# trabajo tiene una clave, volver a pedirlo devuelve el que ya está en curso
+# en vez de lanzar otro. Las páginas consultan el estado sin bloquear y
+# recogen el resultado cuando está listo.
+
+PENDIENTE = "pendiente"
+EN_CURSO = "en curso"
+LISTO = "listo"
+FALLIDO = "fallido"
+
+MAX_HILOS = 2
+MAX_HILOS_INTERACTIVOS = 2  # pool aparte para lo que espera un usuario (segmentar una ruta)
+MAX_TERMINADOS = 50  # trabajos terminados que se conservan para consulta
+
+@dataclass
+class Trabajo:
+    clave: tuple
+    descripcion: str
+    estado: str = PENDIENTE
+    avance: float = 0.0     # 0 a 1, lo informa el propio trabajo
+    mensaje: str = ""
+    resultado: object = None
+    error: object = None    # excepción si terminó en FALLIDO
+    terminado_en: float = None
+    futuro: object = field(default=None, repr=False)
+
+    @property
+    def terminado(self):
+        return self.estado in (LISTO, FALLIDO)
+
+    def informar(self, avance, mensaje=""):
+        self.avance = min(max(float(avance), 0.0), 1.0)
+        self.mensaje = mensaje
+
+class ColaTrabajos:
+    def __init__(self, max_hilos=MAX_HILOS, max_hilos_interactivos=MAX_HILOS_INTERACTIVOS):
+        self._pool = ThreadPoolExecutor(max_workers=max_hilos, thread_name_prefix="trabajo")
+        # un pintado o una capa global larga no deja esperando a las páginas
+        # de una sola ruta
+        self._pool_interactivo = ThreadPoolExecutor(
+            max_workers=max_hilos_interactivos, thread_name_prefix="trabajo_interactivo"
+        )
+        self._trabajos = {}
+        self._candado = threading.Lock()
+
+    # Encola funcion(*args, **kwargs) bajo `clave`, salvo que ya haya un
+    # trabajo con esa clave pendiente o en curso: en ese caso devuelve ese.
+    # Con recibe_trabajo=True la función recibe el Trabajo como primer
+    # argumento, para informar su avance; con interactivo=True corre en el
+    # pool reservado a lo que un usuario está esperando en pantalla.
+    def enviar(self, clave, funcion, *args, descripcion=None, recibe_trabajo=False, interactivo=False, **kwargs):
+        with self._candado:
+            trabajo = self._trabajos.get(clave)
+            if trabajo is not None and not trabajo.terminado:
+                return trabajo
+            self._podar()
+            trabajo = Trabajo(clave, descripcion or str(clave))
+            self._trabajos[clave] = trabajo
+            if recibe_trabajo:
+                args = (trabajo,) + args
+            pool = self._pool_interactivo if interactivo else self._pool
+            trabajo.futuro = pool.submit(self._ejecutar, trabajo, funcion, args, kwargs)
+        return trabajo
+
+    def _ejecutar(self, trabajo, funcion, args, kwargs):
+        trabajo.estado = EN_CURSO
+        try:
+            trabajo.resultado = funcion(*args, **kwargs)
+            trabajo.avance = 1.0
+            estado = LISTO
+        except Exception as e:
+            trabajo.error = e
+            estado = FALLIDO
+        # el estado va al final: quien lo ve terminado ya tiene todo lo demás
+        trabajo.terminado_en = time.time()
+        trabajo.estado = estado
+
+    def _podar(self):
+        terminados = sorted(
+            (t for t in self._trabajos.values() if t.terminado),
+            key=lambda t: t.terminado_en,
+        )
+        for trabajo in terminados[:max(0, len(terminados) - MAX_TERMINADOS + 1)]:
+            del self._trabajos[trabajo.clave]
+
+    def obtener(self, clave):
+        return self._trabajos.get(clave)
+
+    # Con `trabajo`, solo si la clave sigue apuntando a ese mismo trabajo
+    def descartar(self, clave, trabajo=None):
+        with self._candado:
+            actual = self._trabajos.get(clave)
+            if actual is not None and actual.terminado and (trabajo is None or actual is trabajo):
+                del self._trabajos[clave]
+
+# Una sola cola por proceso, compartida por todas las sesiones y páginas (el
+# módulo se importa una vez, igual que un recurso de st.cache_resource).
+_cola = None
+_candado_cola = threading.Lock()
+
+def cola_compartida():
+    global _cola
+    with _candado_cola:
+        if _cola is None:
+            _cola = ColaTrabajos()
+    return _cola
+
+# Envía el trabajo (o se engancha al que ya está en curso) sin bloquear el
+# hilo del script: devuelve (resultado, None) si el trabajo con esa clave ya
+# terminó, o (None, trabajo) mientras sigue, para mostrarlo con
+# seguir_trabajo. Un trabajo terminado se consume una sola vez; el siguiente
+# pedido lanza uno nuevo. Por defecto va al pool interactivo; lo que puede
+# tardar minutos pasa interactivo=False.
+def resultado_o_trabajo(clave, funcion, *args, descripcion=None, interactivo=True, **kwargs):
+    cola = cola_compartida()
+    trabajo = cola.obtener(clave)
+    if trabajo is None or not trabajo.terminado:
+        trabajo = cola.enviar(clave, funcion, *args, descripcion=descripcion, interactivo=interactivo, **kwargs)
+    if not trabajo.terminado:
+        return None, trabajo
+    cola.descartar(clave, trabajo)
+    if trabajo.estado == FALLIDO:
+        raise trabajo.error
+    return trabajo.resultado, None
@@ -0,0 +1,48 @@
+import streamlit as st
+import os
+from nucleo.almacen_rutas import cargar_ruta, ruta_en_cache
+from nucleo.catalogo import catalogo_disponible, construir_catalogo
+from nucleo.trabajos import cola_compartida, resultado_o_trabajo
+
+# ============================
+# AVANCE DE TRABAJOS EN SEGUNDO PLANO
+# ============================
+# Consulta el avance cada segundo sin recargar el resto de la página; cuando
+# el trabajo termina, vuelve a ejecutar la página completa para que muestre
+# el resultado.
+
+@st.fragment(run_every=1.0)
+def seguir_trabajo(clave_trabajo, texto="Procesando rutas..."):
+    trabajo = cola_compartida().obtener(clave_trabajo)
+    if trabajo is None or trabajo.terminado:
+        st.rerun()
+    st.progress(trabajo.avance, text=trabajo.mensaje or texto)
+
+# Ruta preprocesada para las páginas de una sola ruta, sin bloquear el script:
+# si está en cache se lee ahí mismo (mmap, inmediato); si no, se segmenta en
+# el pool interactivo y se muestra el avance. Devuelve None mientras tanto.
+def ruta_o_avance(ruta_fuente):
+    ruta = ruta_en_cache(ruta_fuente)
+    if ruta is not None:
+        return ruta
+    nombre = os.path.basename(ruta_fuente)
+    ruta, trabajo = resultado_o_trabajo(("segmentar", ruta_fuente), cargar_ruta, ruta_fuente, descripcion=f"Segmentar {nombre}")
+    if trabajo is not None:
+        seguir_trabajo(trabajo.clave, f"Segmentando {nombre}...")
+    return ruta
+
+# Catálogo de rutas de una carpeta, con el mismo esquema: si está al día se
+# devuelve enseguida; si hay rutas nuevas o modificadas que leer, se indexan
+# en la cola compartida y se muestra el avance. Devuelve None mientras tanto.
+def catalogo_o_avance(carpeta):
+    catalogo = catalogo_disponible(carpeta)
+    if catalogo is not None:
+        return catalogo
+    carpeta = os.path.abspath(carpeta)
+    catalogo, trabajo = resultado_o_trabajo(
+        ("catalogo", carpeta), construir_catalogo, carpeta,
+        descripcion=f"Indexar {os.path.basename(carpeta)}", recibe_trabajo=True, interactivo=False,
+    )
+    if trabajo is not None:
+        seguir_trabajo(trabajo.clave, "Indexando rutas...")
+    return catalogo
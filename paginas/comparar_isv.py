@@ -0,0 +1,127 @@
+import streamlit as st
+import os
+import folium
+import numpy as np
+import pandas as pd
+from nucleo.clasificacion import ETIQUETAS, clasificar
+from nucleo.indices_excel import valores_ruta
+from nucleo.mapa import (
+    COLOR_DATO_FALTANTE, COLOR_EMPEORA, COLOR_IGUAL, COLOR_MEJORA,
+    agregar_diferencias, agregar_tramos,
+)
+from nucleo.regiones import INDICE_MEJORADO, INDICE_REAL
+from nucleo.simplificacion import DETALLES, nivel_para_detalle
+from paginas.avance import catalogo_o_avance, ruta_o_avance
+from streamlit_folium import st_folium
+
+# ============================
+# COMPARACIÓN DE ÍNDICES
+# ============================
+# La ruta se carga y segmenta una vez; cada índice solo aporta una pasada de
+# clasificación sobre la misma geometría.
+
+MODO_LADO_A_LADO = "Lado a lado"
+MODO_DIFERENCIAS = "Diferencias"
+
+def _mapa_base(bounds):
+    m = folium.Map()
+    folium.TileLayer(
+        tiles="https://{s}.google.com/vt/lyrs=y&x={x}&y={y}&z={z}",
+        attr="Google Hybrid",
+        name="Satélite + Nombres",
+        max_zoom=20,
+        subdomains=["mt0", "mt1", "mt2", "mt3"]
+    ).add_to(m)
+    folium.TileLayer("OpenStreetMap", name="Mapa base").add_to(m)
+    m.fit_bounds(bounds)
+    return m
+
+def mostrar_comparacion(region):
+    st.markdown("<h1 style='font-size: 30px;'>↔️ Comparar índices ISV</h1>", unsafe_allow_html=True)
+
+    if not os.path.exists(region.carpeta_kmz):
+        st.error(f"No se encontró la carpeta de archivos KMZ: {region.carpeta_kmz}")
+        return
+
+    tipos = sorted(region.indices)
+    if len(tipos) < 2:
+        st.warning("Se necesitan al menos dos libros de índices en la región para comparar.")
+        return
+    catalogo = catalogo_o_avance(region.carpeta_kmz)
+    if catalogo is None:
+        return
+    if not catalogo:
+        st.warning("No se encontraron archivos KMZ.")
+        return
+
+    etiqueta = lambda t: region.indices[t].etiqueta
+    col_a, col_b = st.columns(2)
+    with col_a:
+        tipo_a = st.selectbox("Índice A:", tipos, index=tipos.index(INDICE_MEJORADO) if INDICE_MEJORADO in tipos else 0, format_func=etiqueta, key="comparar_a")
+    with col_b:
+        tipo_b = st.selectbox("Índice B:", tipos, index=tipos.index(INDICE_REAL) if INDICE_REAL in tipos else 1, format_func=etiqueta, key="comparar_b")
+
+    ruta_seleccionada = st.selectbox("Selecciona una ruta:", catalogo.ids(), format_func=lambda r: catalogo[r].etiqueta, key="comparar_ruta")
+    modo = st.radio("Vista:", [MODO_DIFERENCIAS, MODO_LADO_A_LADO], horizontal=True, key="comparar_modo")
+    detalle = st.radio("Detalle del trazado:", DETALLES, horizontal=True, key="comparar_detalle")
+
+    kmz_path = catalogo[ruta_seleccionada].fuente
+    try:
+        ruta = ruta_o_avance(kmz_path)
+    except Exception as e:
+        st.error(f"Error al procesar la ruta: {e}")
+        return
+    if ruta is None:
+        return
+
+    bounds = ruta.bounds
+    segmentos = ruta.segmentos(nivel_para_detalle(detalle, bounds))
+    valores_a = valores_ruta(*region.fuente(tipo_a), ruta_seleccionada)
+    valores_b = valores_ruta(*region.fuente(tipo_b), ruta_seleccionada)
+    if valores_a is None and valores_b is None:
+        st.warning("Ninguno de los dos libros tiene datos para esta ruta.")
+        return
+    categorias_a = clasificar(valores_a, len(segmentos))
+    categorias_b = clasificar(valores_b, len(segmentos))
+    cambio = categorias_a != categorias_b
+
+    st.info(f"📏 Longitud: {ruta.longitud_m / 1000:.2f} km · {int(cambio.sum())} de {len(segmentos)} km cambian de categoría")
+
+    if modo == MODO_LADO_A_LADO:
+        col1, col2 = st.columns(2)
+        for col, tipo, categorias, clave in ((col1, tipo_a, categorias_a, "mapa_a"), (col2, tipo_b, categorias_b, "mapa_b")):
+            with col:
+                st.markdown(f"**{etiqueta(tipo)}**")
+                m = _mapa_base(bounds)
+                agregar_tramos(m, segmentos, categorias)
+                st_folium(m, use_container_width=True, height=550, key=clave, returned_objects=[])
+    else:
+        col1, col2 = st.columns([1, 4])
+        with col1:
+            st.markdown("### 🗺️ Leyenda")
+            st.markdown(f"""
+            <div style='line-height: 2'>
+            <span style='background-color:{COLOR_EMPEORA};padding:5px 10px;margin-right:5px;'></span> Sube de categoría en B<br>
+            <span style='background-color:{COLOR_MEJORA};padding:5px 10px;margin-right:5px;'></span> Baja de categoría en B<br>
+            <span style='background-color:{COLOR_DATO_FALTANTE};padding:5px 10px;margin-right:5px;'></span> Solo uno tiene datos<br>
+            <span style='background-color:{COLOR_IGUAL};padding:5px 10px;margin-right:5px;'></span> Sin cambio
+            </div>
+            """, unsafe_allow_html=True)
+        with col2:
+            m = _mapa_base(bounds)
+            agregar_diferencias(m, segmentos, categorias_a, categorias_b)
+            folium.LayerControl().add_to(m)
+            st_folium(m, use_container_width=True, height=650, key="mapa_diferencias", returned_objects=[])
+
+    if cambio.any():
+        st.markdown("### 📋 Km con cambio de categoría")
+        km = np.flatnonzero(cambio)
+        st.dataframe(
+            pd.DataFrame({
+                "Km": km + 1,
+                etiqueta(tipo_a): [ETIQUETAS[c] for c in categorias_a[km].tolist()],
+                etiqueta(tipo_b): [ETIQUETAS[c] for c in categorias_b[km].tolist()],
+            }),
+            use_container_width=True,
+            hide_index=True,
+        )
@@ -0,0 +1,21 @@
+import os
+import streamlit as st
+
+# ============================
+# SELECCIÓN DE ESCENARIO
+# ============================
+# Escenarios del mismo índice (en sur, p. ej., los libros B a E). Devuelve
+# (tipo, archivo_excel, hoja) del elegido, o None después de mostrar el
+# error si la región no tiene libros de ese índice o falta el Excel.
+
+def selector_escenario(region, tipo_indice, key):
+    escenarios = region.escenarios(tipo_indice)
+    if not escenarios:
+        st.error(f"No se encontró ningún libro de índices {tipo_indice} en `{region.carpeta}`.")
+        return None
+    tipo = st.selectbox("Escenario:", escenarios, format_func=lambda t: region.indices[t].etiqueta, key=key)
+    archivo_excel, hoja = region.fuente(tipo)
+    if not os.path.exists(archivo_excel):
+        st.error(f"No se encontró el archivo Excel: {archivo_excel}")
+        return None
+    return tipo, archivo_excel, hoja
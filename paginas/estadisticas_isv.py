@@ -0,0 +1,69 @@
+import streamlit as st
+import os
+import pandas as pd
+from nucleo.estadisticas import diferencias_indices, resumen_indices
+from nucleo.regiones import INDICE_MEJORADO, INDICE_REAL, REGIONES
+from paginas.avance import catalogo_o_avance
+
+# ============================
+# ESTADÍSTICAS Y RANKING ISV
+# ============================
+# Resume todas las rutas de las regiones elegidas, para cada índice
+# registrado, sin abrir rutas una por una. Las tablas se ordenan haciendo
+# clic en el encabezado de cada columna.
+
+def mostrar_estadisticas(region):
+    st.markdown("<h1 style='font-size: 30px;'>📊 Estadísticas y ranking ISV</h1>", unsafe_allow_html=True)
+
+    claves = st.multiselect(
+        "Regiones:",
+        list(REGIONES),
+        default=[region.clave],
+        format_func=lambda c: REGIONES[c].nombre,
+    )
+
+    # los catálogos que falten se indexan en segundo plano antes de resumir
+    for clave in claves:
+        carpeta_kmz = REGIONES[clave].carpeta_kmz
+        if os.path.isdir(carpeta_kmz) and catalogo_o_avance(carpeta_kmz) is None:
+            return
+
+    tablas = []
+    for clave in claves:
+        r = REGIONES[clave]
+        for tipo in r.indices:
+            try:
+                tablas.append(resumen_indices(r, tipo))
+            except Exception as e:
+                st.warning(f"⚠️ No se pudo resumir {tipo} de {r.nombre}: {e}")
+
+    if not tablas:
+        st.warning("No hay índices para las regiones seleccionadas.")
+        return
+
+    tabla = pd.concat(tablas, ignore_index=True)
+    tipos = sorted(tabla["Índice"].unique())
+    elegidos = st.multiselect("Índices:", tipos, default=tipos)
+
+    st.markdown("### 🏁 Rutas por km en CAT 4-5")
+    st.dataframe(
+        tabla[tabla["Índice"].isin(elegidos)].sort_values("Km CAT ≥ 4", ascending=False),
+        use_container_width=True,
+        hide_index=True,
+    )
+
+    st.markdown(f"### ↔️ {INDICE_MEJORADO} vs {INDICE_REAL}")
+    diferencias = []
+    for clave in claves:
+        r = REGIONES[clave]
+        if INDICE_MEJORADO in r.indices and INDICE_REAL in r.indices:
+            try:
+                diferencias.append(diferencias_indices(r, INDICE_MEJORADO, INDICE_REAL))
+            except Exception as e:
+                st.warning(f"⚠️ No se pudo comparar {r.nombre}: {e}")
+    if diferencias:
+        st.dataframe(
+            pd.concat(diferencias, ignore_index=True).sort_values("Km con cambio de categoría", ascending=False),
+            use_container_width=True,
+            hide_index=True,
+        )
@@ -0,0 +1,144 @@
+import os
+import streamlit as st
+import folium
+from streamlit_folium import st_folium
+import plotly.graph_objects as go
+import numpy as np
+from nucleo.perfil import UMBRAL_PENDIENTE, perfil_elevacion
+from nucleo.simplificacion import nivel_para_bounds
+from paginas.avance import catalogo_o_avance, ruta_o_avance
+
+# ============================
+# VERIFICACIÓN DE CARPETAS
+# ============================
+
+def carpetas_a_verificar(region):
+    return [
+        (region.carpeta_kmz, ".kmz"),
+        (os.path.join(region.carpeta, "datos_csv"), ".csv"),
+        (os.path.join(region.carpeta, "shapefiles"), ".shp"),
+    ]
+
+def inicializar(region):
+    for ruta, extension in carpetas_a_verificar(region):
+        if not os.path.exists(ruta):
+            st.warning(f"⚠️ La carpeta `{ruta}` no existe.")
+        else:
+            archivos_validos = [f for f in os.listdir(ruta) if f.endswith(extension)]
+            if not archivos_validos:
+                st.warning(f"⚠️ La carpeta `{ruta}` está vacía o no contiene archivos `{extension}`.")
+
+# ============================
+# PÁGINA PRINCIPAL
+# ============================
+
+def mostrar_home(region):
+    carpeta_kmz = region.carpeta_kmz
+
+    st.markdown("<h1 style='font-size: 15px;'>📍 Visualizador de Rutas</h1>", unsafe_allow_html=True)
+
+    try:
+        catalogo = catalogo_o_avance(carpeta_kmz)
+    except FileNotFoundError:
+        st.error(f"La carpeta `{carpeta_kmz}` no existe.")
+        return
+    if catalogo is None:
+        return
+
+    if not catalogo:
+        st.warning("No se encontraron archivos KMZ.")
+        return
+
+    ruta_seleccionada = st.selectbox("Selecciona una ruta:", catalogo.ids(), format_func=lambda r: catalogo[r].etiqueta)
+
+    if ruta_seleccionada:
+        entrada = catalogo[ruta_seleccionada]
+        if entrada.fuente:
+            ruta = entrada.fuente
+            try:
+                ruta_procesada = ruta_o_avance(ruta)
+                if ruta_procesada is None:
+                    return
+
+                bounds = ruta_procesada.bounds
+                linea = {
+                    "type": "LineString",
+                    "coordinates": ruta_procesada.trazado(nivel_para_bounds(bounds)).tolist(),
+                }
+
+                m = folium.Map()
+                folium.TileLayer("OpenStreetMap", name="Mapa Base").add_to(m)
+                folium.TileLayer(
+                    tiles="https://server.arcgisonline.com/ArcGIS/rest/services/World_Imagery/MapServer/tile/{z}/{y}/{x}",
+                    attr="Esri",
+                    name="Satélite",
+                    overlay=False,
+                    control=True
+                ).add_to(m)
+                folium.TileLayer(
+                    tiles="https://services.arcgisonline.com/ArcGIS/rest/services/Reference/World_Boundaries_and_Places/MapServer/tile/{z}/{y}/{x}",
+                    attr="Esri",
+                    name="Etiquetas",
+                    overlay=True,
+                    control=True
+                ).add_to(m)
+
+                m.fit_bounds(bounds)
+
+                folium.GeoJson(linea, style_function=lambda x: {"color": "black", "weight": 8}).add_to(m)
+                folium.GeoJson(linea, style_function=lambda x: {"color": "#3388ff", "weight": 4}).add_to(m)
+                folium.LayerControl().add_to(m)
+
+                st_folium(m, use_container_width=True, height=400)
+
+                perfil = perfil_elevacion(ruta_procesada)
+
+                st.markdown(f"**📈 Elevación:** mínima {perfil.elev_min} m, máxima {perfil.elev_max} m")
+                col1, col2, col3 = st.columns(3)
+                col1.metric("Ascenso acumulado", f"{perfil.ascenso_m:,.0f} m")
+                col2.metric("Descenso acumulado", f"{perfil.descenso_m:,.0f} m")
+                col3.metric(f"Km con pendiente ≥ {UMBRAL_PENDIENTE:g}%", len(perfil.km_empinados()))
+
+                fig = go.Figure()
+                fig.add_trace(go.Scatter(
+                    x=perfil.distancia,
+                    y=perfil.elevacion,
+                    mode="lines",
+                    line=dict(color="mediumslateblue", width=3),
+                    fill="tozeroy",
+                    name="Altura (m)"
+                ))
+                fig.update_layout(
+                    margin=dict(l=20, r=20, t=30, b=20),
+                    xaxis_title="Distancia (m)",
+                    yaxis_title="Elevación (m)",
+                    template="plotly_white",
+                    height=200,
+                    showlegend=False
+                )
+
+                st.plotly_chart(fig, use_container_width=True)
+
+                # Pendiente media de cada km; los empinados en rojo
+                empinado = np.abs(perfil.pendientes) >= UMBRAL_PENDIENTE
+                fig_pend = go.Figure()
+                fig_pend.add_trace(go.Bar(
+                    x=np.arange(1, len(perfil.pendientes) + 1),
+                    y=np.round(perfil.pendientes, 2),
+                    marker_color=np.where(empinado, "#FF0000", "mediumslateblue"),
+                    name="Pendiente (%)"
+                ))
+                fig_pend.update_layout(
+                    margin=dict(l=20, r=20, t=30, b=20),
+                    xaxis_title="Km",
+                    yaxis_title="Pendiente (%)",
+                    template="plotly_white",
+                    height=200,
+                    showlegend=False
+                )
+                st.plotly_chart(fig_pend, use_container_width=True)
+
+            except Exception as e:
+                st.error(f"Error al procesar el archivo KMZ: {e}")
+        else:
+            st.warning("No se encontró el archivo KMZ para esta ruta.")
@@ -0,0 +1,84 @@
+import streamlit as st
+import os
+import math
+import folium
+from nucleo.clasificacion import clasificar
+from nucleo.indices_excel import valores_ruta
+from nucleo.mapa import agregar_tramos, leyenda_html
+from nucleo.regiones import INDICE_MEJORADO
+from nucleo.simplificacion import DETALLES, nivel_para_detalle
+from paginas.avance import catalogo_o_avance, ruta_o_avance
+from paginas.escenarios import selector_escenario
+from streamlit_folium import st_folium
+
+def mostrar_isv(region):
+    carpeta_kmz = region.carpeta_kmz
+
+    st.markdown("<h1 style='font-size: 30px;'>🗺️ Mapa ISV Mejorado</h1>", unsafe_allow_html=True)
+
+    escenario = selector_escenario(region, INDICE_MEJORADO, key="escenario_isv")
+    if escenario is None:
+        return
+    _, archivo_excel, hoja = escenario
+
+    # Validaciones previas
+    if not os.path.exists(carpeta_kmz):
+        st.error(f"No se encontró la carpeta de archivos KMZ: {carpeta_kmz}")
+        return
+
+    catalogo = catalogo_o_avance(carpeta_kmz)
+    if catalogo is None:
+        return
+    if not catalogo:
+        st.warning("No se encontraron archivos KMZ.")
+        return
+
+    ruta_seleccionada = st.selectbox("Selecciona una ruta:", catalogo.ids(), format_func=lambda r: catalogo[r].etiqueta)
+    detalle = st.radio("Detalle del trazado:", DETALLES, horizontal=True, key="detalle_isv")
+
+    if ruta_seleccionada:
+        valores = valores_ruta(archivo_excel, hoja, ruta_seleccionada)
+        if valores is None:
+            st.warning("No se encontraron datos para esta ruta en el Excel.")
+            return
+
+        ruta_fuente = catalogo[ruta_seleccionada].fuente
+
+        try:
+            ruta = ruta_o_avance(ruta_fuente)
+            if ruta is None:
+                return
+            long_km = ruta.longitud_m / 1000
+            st.info(f"📏 Longitud total de la ruta: {long_km:.2f} km")
+
+            bounds = ruta.bounds
+            segmentos = ruta.segmentos(nivel_para_detalle(detalle, bounds))
+
+            if len(valores) < len(segmentos):
+                st.warning(f"La ruta tiene {len(segmentos)} tramos, pero el Excel solo tiene {len(valores)} valores. El resto será blanco.")
+
+            m = folium.Map()
+            folium.TileLayer(
+                tiles="https://{s}.google.com/vt/lyrs=y&x={x}&y={y}&z={z}",
+                attr="Google Hybrid",
+                name="Satélite + Nombres",
+                max_zoom=20,
+                subdomains=["mt0", "mt1", "mt2", "mt3"]
+            ).add_to(m)
+            folium.TileLayer("OpenStreetMap", name="Mapa base").add_to(m)
+            m.fit_bounds(bounds)
+
+            categorias = clasificar(valores, len(segmentos))
+            agregar_tramos(m, segmentos, categorias)
+
+            folium.LayerControl().add_to(m)
+
+            col1, col2 = st.columns([1, 4])
+            with col1:
+                st.markdown("### 🗺️ Leyenda")
+                st.markdown(leyenda_html(), unsafe_allow_html=True)
+            with col2:
+                st_folium(m, use_container_width=True, height=650)
+
+        except Exception as e:
+            st.error(f"Error al procesar la ruta: {e}")
@@ -0,0 +1,139 @@
+import streamlit as st
+import os
+import math
+import folium
+from dataclasses import dataclass
+from nucleo.almacen_rutas import huella_fuente
+from nucleo.cache_lru import cache_rutas_compartido
+from nucleo.clasificacion import clasificar
+from nucleo.indices_excel import huella_libro, valores_ruta
+from nucleo.mapa import agregar_tramos, leyenda_html
+from nucleo.regiones import INDICE_REAL
+from nucleo.simplificacion import DETALLES, nivel_para_detalle
+from paginas.avance import catalogo_o_avance, ruta_o_avance
+from paginas.escenarios import selector_escenario
+from streamlit_folium import st_folium
+
+# Lo que la página necesita de una ruta ya segmentada y clasificada
+@dataclass
+class EstadoRuta:
+    segmentos: object   # RutaSegmentada al detalle elegido
+    valores: object     # valores ISV por km
+    categorias: object  # códigos de clasificar()
+    long_km: float
+    bounds: list
+
+def mostrar_isvr(region):
+    carpeta_kml = region.carpeta_kmz
+
+    opciones_capa = {
+        "Satélite + Nombres (limpio)": {
+            "tiles": "https://{s}.google.com/vt/lyrs=s,h&x={x}&y={y}&z={z}",
+            "subdomains": ["mt0", "mt1", "mt2", "mt3"],
+            "attr": "Google Maps Satélite + Nombres"
+        },
+        "Mapa base (OpenStreetMap)": {
+            "tiles": "OpenStreetMap",
+            "attr": "OpenStreetMap"
+        }
+    }
+
+    st.markdown("<h1 style='font-size: 30px;'>🗺️ Mapa ISV Real</h1>", unsafe_allow_html=True)
+
+    escenario = selector_escenario(region, INDICE_REAL, key="escenario_isvr")
+    if escenario is None:
+        return
+    _, archivo_excel, hoja = escenario
+
+    # Validaciones iniciales
+    if not os.path.exists(carpeta_kml):
+        st.error(f"No se encontró la carpeta de archivos KML: {carpeta_kml}")
+        return
+
+    catalogo = catalogo_o_avance(carpeta_kml)
+    if catalogo is None:
+        return
+    rutas_disponibles = catalogo.ids()
+    if not rutas_disponibles:
+        st.warning("No se encontraron archivos KML.")
+        return
+
+    capa_seleccionada = st.selectbox("🗺️ Elige la capa base del mapa:", list(opciones_capa.keys()), key="capa_base_mapa")
+
+    ruta_seleccionada = st.selectbox("Selecciona una ruta:", rutas_disponibles, format_func=lambda r: catalogo[r].etiqueta, key="select_ruta_isvr")
+    detalle = st.radio("Detalle del trazado:", DETALLES, horizontal=True, key="detalle_isvr")
+
+    # === FUNCIONES INTERNAS ===
+
+    def construir_mapa(estado, capa_base):
+        m = folium.Map()
+        capa_info = opciones_capa[capa_base]
+        folium.TileLayer(
+            tiles=capa_info["tiles"],
+            attr=capa_info["attr"],
+            subdomains=capa_info.get("subdomains", []),
+            max_zoom=20,
+            name=capa_base
+        ).add_to(m)
+
+        m.fit_bounds(estado.bounds)
+
+        agregar_tramos(m, estado.segmentos, estado.categorias)
+
+        return m
+
+    if ruta_seleccionada:
+        # Estado de la ruta en el cache LRU del proceso, compartido entre
+        # sesiones. Las huellas del archivo y del libro en la clave hacen que
+        # un KML/KMZ o Excel modificado arme una entrada nueva; la vieja sale
+        # por LRU.
+        ruta = catalogo[ruta_seleccionada].fuente
+        clave = (
+            region.clave, ruta_seleccionada, archivo_excel, hoja, detalle,
+            huella_fuente(ruta), huella_libro(archivo_excel),
+        )
+        cache = cache_rutas_compartido()
+        estado = cache.obtener(clave)
+
+        if estado is None:
+            valores = valores_ruta(archivo_excel, hoja, ruta_seleccionada)
+            if valores is None:
+                st.warning("No se encontraron datos para esta ruta en el Excel.")
+                st.info("Revisa que el nombre en el Excel coincida exactamente con el sufijo del nombre del KML.")
+                return
+
+            try:
+                ruta_procesada = ruta_o_avance(ruta)
+                if ruta_procesada is None:
+                    return
+                bounds = ruta_procesada.bounds
+                segmentos = ruta_procesada.segmentos(nivel_para_detalle(detalle, bounds))
+            except Exception as e:
+                st.error(f"Error al procesar la ruta: {e}")
+                return
+
+            estado = cache.guardar(clave, EstadoRuta(
+                segmentos=segmentos,
+                valores=valores,
+                categorias=clasificar(valores, len(segmentos)),
+                long_km=ruta_procesada.longitud_m / 1000,
+                bounds=bounds,
+            ))
+
+        long_km = estado.long_km
+        m = construir_mapa(estado, capa_seleccionada)
+
+        st.info(f"📏 Longitud total de la ruta: {long_km:.2f} km")
+        col1, col2 = st.columns([1, 4])
+        with col1:
+            st.markdown("### 🗺️ Leyenda")
+            st.markdown(leyenda_html(), unsafe_allow_html=True)
+        with col2:
+            st_folium(m, use_container_width=True, height=650, key="mapa")
+
+        uso = cache.estadisticas()
+        st.caption(
+            f"Cache de rutas: {uso.entradas} entradas, {uso.bytes_usados / 1e6:.1f} de "
+            f"{uso.presupuesto_bytes / 1e6:.0f} MB · {uso.aciertos} aciertos, {uso.fallos} fallos, "
+            f"{uso.desalojos} desalojos"
+        )
@@ -0,0 +1,88 @@
+import streamlit as st
+import os
+import math
+import folium
+from nucleo.capa_global import DESACTUALIZADA, capa_global, rutas_region, trabajo_capa
+from nucleo.mapa import agregar_coleccion, leyenda_html
+from nucleo.regiones import INDICE_MEJORADO, INDICE_REAL
+from nucleo.trabajos import FALLIDO
+from paginas.avance import catalogo_o_avance, seguir_trabajo
+from paginas.escenarios import selector_escenario
+from streamlit_folium import st_folium
+
+# ============================
+# MAPA GLOBAL DE UNA REGIÓN
+# ============================
+# Una sola página para todos los índices: el registro la da de alta una vez
+# por índice (Global ISV Mejorado, Global ISV Real).
+
+TITULOS = {INDICE_MEJORADO: "Mejorado", INDICE_REAL: "Real"}
+
+def mostrar_mapa_global(tipo_indice, region):
+    carpeta_kmz = region.carpeta_kmz
+
+    titulo = TITULOS.get(tipo_indice, tipo_indice)
+    st.markdown(f"<h1 style='font-size: 30px;'>🗺️ Mapa ISV Global {titulo}</h1>", unsafe_allow_html=True)
+
+    escenario = selector_escenario(region, tipo_indice, key=f"escenario_global_{tipo_indice}")
+    if escenario is None:
+        return
+    tipo = escenario[0]
+
+    # Validaciones
+    if not os.path.exists(carpeta_kmz):
+        st.error(f"No se encontró la carpeta de archivos KMZ: {carpeta_kmz}")
+        return
+
+    if catalogo_o_avance(carpeta_kmz) is None:
+        return
+    rutas_disponibles = rutas_region(region)
+
+    if not rutas_disponibles:
+        st.warning("No se encontraron archivos KMZ en la carpeta.")
+        return
+
+    # === CAPA GLOBAL (precalculada) ===
+
+    coleccion, errores, estado = capa_global(region, tipo)
+    if coleccion is None:
+        trabajo = trabajo_capa(region, tipo)
+        if trabajo is None:
+            st.rerun()  # terminó entre ambas consultas
+        if trabajo.estado == FALLIDO:
+            st.error(f"No se pudo construir el mapa global: {trabajo.error}")
+            return
+        st.info("Construyendo el mapa global por primera vez...")
+        seguir_trabajo(trabajo.clave)
+        return
+    if estado == DESACTUALIZADA:
+        # una reconstrucción fallida no se relanza hasta que cambien las entradas
+        trabajo = trabajo_capa(region, tipo)
+        if trabajo is not None and trabajo.estado == FALLIDO:
+            st.error(f"No se pudo actualizar el mapa global, se muestra la versión anterior: {trabajo.error}")
+        else:
+            st.info("🔄 Cambiaron los KMZ o el Excel: se muestra la versión anterior mientras se actualiza en segundo plano.")
+
+    for ruta_sufijo, error in errores:
+        st.error(f"❌ Error al procesar la ruta {ruta_sufijo}: {error}")
+
+    # === MAPA Y VISUALIZACIÓN ===
+
+    m = folium.Map()
+    folium.TileLayer(
+        tiles="https://{s}.google.com/vt/lyrs=y&x={x}&y={y}&z={z}",
+        attr="Google Hybrid",
+        name="Satélite + Nombres",
+        max_zoom=20,
+        subdomains=["mt0", "mt1", "mt2", "mt3"]
+    ).add_to(m)
+    folium.TileLayer("OpenStreetMap", name="Mapa base").add_to(m)
+
+    agregar_coleccion(m, coleccion, contorno=False)
+    folium.LayerControl().add_to(m)
+
+    st.markdown("### 🗺️ Leyenda")
+    st.markdown(leyenda_html(), unsafe_allow_html=True)
+
+    # Sin valores de vuelta: mover o acercar el mapa no provoca un rerun
+    st_folium(m, use_container_width=True, height=650, returned_objects=[])
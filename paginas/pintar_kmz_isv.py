@@ -0,0 +1,120 @@
+import streamlit as st
+import zipfile
+import os
+import folium
+from nucleo.indices_excel import valores_ruta
+from nucleo.regiones import INDICE_MEJORADO
+from nucleo.kml import abrir_kml_de_kmz, iterar_coordenadas
+from nucleo.pintado import TrabajoPintado, limpiar_temporales, pintar_rutas
+from nucleo.trabajos import FALLIDO, cola_compartida
+from paginas.avance import catalogo_o_avance, seguir_trabajo
+from streamlit_folium import st_folium
+
+def inicializar(region):
+    # Crear carpeta y .gitkeep si vacía
+    carpeta_salida = region.carpeta_salida
+    os.makedirs(carpeta_salida, exist_ok=True)
+    if not os.listdir(carpeta_salida):
+        with open(os.path.join(carpeta_salida, ".gitkeep"), "w") as f:
+            f.write("")
+    # Restos de guardados interrumpidos en sesiones anteriores
+    limpiar_temporales(carpeta_salida)
+
+def pintar_kmz_isv(region):
+    carpeta_kmz = region.carpeta_kmz
+    carpeta_salida = region.carpeta_salida
+    archivo_excel, hoja = region.fuente(INDICE_MEJORADO)
+
+    st.markdown("<h1 style='font-size: 30px;'>🖍️ Pintar y Exportar KMZs con ISV</h1>", unsafe_allow_html=True)
+
+    if not os.path.exists(archivo_excel):
+        st.error(f"No se encontró el archivo Excel: {archivo_excel}")
+        return
+    else:
+        st.info(f"📄 Usando archivo Excel: `{archivo_excel}`")
+
+    if not os.path.exists(carpeta_kmz):
+        st.error(f"No se encontró la carpeta de archivos KMZ: {carpeta_kmz}")
+        return
+
+    catalogo = catalogo_o_avance(carpeta_kmz)
+    if catalogo is None:
+        return
+    rutas_disponibles = list(catalogo)
+    if not rutas_disponibles:
+        st.warning("No se encontraron archivos KMZ en la carpeta.")
+        return
+
+    agrupar = st.checkbox(
+        "Agrupar tramos consecutivos de igual categoría (KMZ más livianos para Google Earth)",
+        value=False,
+    )
+    ejecutar = st.button("🖍️ Pintar y exportar KMZs")
+
+    cola = cola_compartida()
+    clave_trabajo = ("pintar_kmz", region.clave)
+
+    if ejecutar:
+        trabajos = []
+        for entrada in rutas_disponibles:
+            ruta_nombre = os.path.splitext(os.path.basename(entrada.kmz or entrada.kml))[0]
+            # En el Excel la ruta aparece con el sufijo del archivo (p. ej. "A-65")
+            valores = valores_ruta(archivo_excel, hoja, entrada.id)
+            trabajos.append(TrabajoPintado(ruta_nombre, entrada.fuente, valores, carpeta_salida, agrupar))
+
+        # Si ya hay un pintado de esta región en curso, se sigue ese
+        cola.enviar(
+            clave_trabajo,
+            _pintar_en_segundo_plano,
+            trabajos,
+            descripcion=f"Pintar KMZs de {region.nombre}",
+            recibe_trabajo=True,
+        )
+
+    trabajo = cola.obtener(clave_trabajo)
+    if trabajo is None:
+        return
+    if not trabajo.terminado:
+        seguir_trabajo(clave_trabajo)
+        return
+
+    if trabajo.estado == FALLIDO:
+        st.error(f"❌ Error al pintar los KMZs: {repr(trabajo.error)}")
+        return
+
+    generados, fallas = trabajo.resultado
+    for nombre, kmz_out in generados:
+        st.success(f"✅ KMZ generado: `{kmz_out}`")
+    for nombre, error in fallas:
+        st.error(f"❌ Error al procesar {nombre}: {error}")
+
+    if fallas:
+        st.warning(f"⚠️ Se generaron {len(generados)} KMZ pintados; {len(fallas)} rutas fallaron.")
+    else:
+        st.success("🎉 ¡Todos los archivos KMZ pintados fueron generados!")
+
+    # VISUALIZACIÓN
+    st.markdown("### 🗺️ Visualización de KMZs pintados")
+    m = folium.Map()
+    folium.TileLayer("OpenStreetMap").add_to(m)
+
+    for archivo in os.listdir(carpeta_salida):
+        if archivo.endswith("_pintado.kmz"):
+            try:
+                with zipfile.ZipFile(os.path.join(carpeta_salida, archivo), 'r') as z:
+                    with abrir_kml_de_kmz(z) as kml_data:
+                        for coords in iterar_coordenadas(kml_data):
+                            if len(coords):
+                                folium.PolyLine(coords[:, 1::-1].tolist(), color="blue", weight=3).add_to(m)
+            except:
+                continue
+
+    st_folium(m, use_container_width=True, height=600)
+
+# Corre en la cola de trabajos: el pintado sigue aunque la página se
+# vuelva a ejecutar por un cambio en algún control.
+def _pintar_en_segundo_plano(trabajo, trabajos):
+    def al_avanzar(hechos, total, trabajo_pintado, kmz_out, error):
+        trabajo.informar(hechos / total, f"Procesado {trabajo_pintado.nombre} ({hechos}/{total})")
+
+    return pintar_rutas(trabajos, al_avanzar=al_avanzar)
@@ -0,0 +1,43 @@
+import importlib
+from functools import partial
+
+from nucleo.regiones import INDICE_MEJORADO, INDICE_REAL
+
+# ============================
+# REGISTRO DE PÁGINAS
+# ============================
+# Cada página se importa recién cuando se selecciona, de modo que folium,
+# plotly, shapely, pandas, etc. solo se cargan si la página los usa. Todas
+# reciben la región seleccionada, después de los argumentos fijos que traiga
+# la entrada (así una misma página sirve para varios índices). Si el módulo
+# define inicializar(region), se ejecuta una vez por proceso y región antes
+# de mostrar la página por primera vez (ahí van los efectos que antes corrían
+# al importar).
+
+PAGINAS = {
+    "Home": ("paginas.home", "mostrar_home"),
+    "ISV Mejorado": ("paginas.isv_mejorado", "mostrar_isv"),
+    "ISV Real": ("paginas.isv_real", "mostrar_isvr"),
+    "Ruta 3D": ("paginas.ruta_3d", "mostrar_ruta_3d"),
+    "Global ISV Mejorado": ("paginas.mapa_global", "mostrar_mapa_global", INDICE_MEJORADO),
+    "Global ISV Real": ("paginas.mapa_global", "mostrar_mapa_global", INDICE_REAL),
+    "Pintar KMZs ISV": ("paginas.pintar_kmz_isv", "pintar_kmz_isv"),
+    "Comparar ISV": ("paginas.comparar_isv", "mostrar_comparacion"),
+    "Estadísticas ISV": ("paginas.estadisticas_isv", "mostrar_estadisticas"),
+}
+
+_inicializadas = set()
+
+def cargar_pagina(nombre):
+    nombre_modulo, nombre_funcion, *argumentos = PAGINAS[nombre]
+    modulo = importlib.import_module(nombre_modulo)
+    return modulo, partial(getattr(modulo, nombre_funcion), *argumentos)
+
+def mostrar_pagina(nombre, region):
+    modulo, mostrar = cargar_pagina(nombre)
+    if (nombre, region.clave) not in _inicializadas:
+        inicializar = getattr(modulo, "inicializar", None)
+        if inicializar is not None:
+            inicializar(region)
+        _inicializadas.add((nombre, region.clave))
+    mostrar(region)
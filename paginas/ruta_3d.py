@@ -1,6 +1,6 @@
 import streamlit as st
 
-def mostrar_ruta_3d():
+def mostrar_ruta_3d(region=None):
     st.title("🛰️ Visor 3D de Calzada en CesiumJS")
 
     st.markdown("Abre el visor interactivo en una nueva pestaña:")
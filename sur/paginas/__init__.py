@@ -1 +0,0 @@
-# Esto hace que Python reconozca esta carpeta como un paquete
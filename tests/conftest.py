@@ -0,0 +1,6 @@
+import os
+import sys
+
+# Los tests importan nucleo.* desde la raíz del repositorio, igual que app2.py
+RAIZ = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, RAIZ)
@@ -0,0 +1,24 @@
+import numpy as np
+
+from nucleo.cache_lru import CacheLRU, tamano_bytes
+
+def test_desaloja_la_menos_usada():
+    cache = CacheLRU(presupuesto_bytes=3 * 8000)
+    for i in range(5):
+        cache.obtener_o_construir(("ruta", i), lambda: np.zeros(1000))
+    cache.obtener_o_construir(("ruta", 4), lambda: np.zeros(1000))
+
+    assert len(cache) == 3
+    assert ("ruta", 1) not in cache and ("ruta", 4) in cache
+    estadisticas = cache.estadisticas()
+    assert (estadisticas.aciertos, estadisticas.fallos, estadisticas.desalojos) == (1, 5, 2)
+    assert estadisticas.bytes_usados == 3 * 8000
+
+def test_valor_mayor_que_el_presupuesto_no_se_guarda():
+    cache = CacheLRU(presupuesto_bytes=100)
+    valor = cache.guardar("grande", np.zeros(1000))
+    assert len(valor) == 1000 and "grande" not in cache
+
+def test_memmap_no_cuenta(tmp_path):
+    arreglo = np.lib.format.open_memmap(tmp_path / "a.npy", mode="w+", dtype=np.float64, shape=(1000,))
+    assert tamano_bytes((arreglo, np.zeros(10))) == 80
@@ -0,0 +1,21 @@
+import os
+
+import pytest
+
+from nucleo.catalogo import CatalogoRutas, _entradas_sin_datos
+from nucleo.regiones import REGIONES
+
+# Cada id que producía split("_")[-1] sobre os.listdir (KMZ en casi todas las
+# páginas, KML en ISV Real) sigue resolviendo a una ruta del catálogo
+@pytest.mark.parametrize("clave", list(REGIONES))
+def test_catalogo_cubre_ids_antiguos(clave):
+    carpeta = REGIONES[clave].carpeta_kmz
+    if not os.path.isdir(carpeta):
+        pytest.skip(f"sin carpeta {carpeta}")
+    catalogo = CatalogoRutas(carpeta, _entradas_sin_datos(carpeta))
+    antiguos = {
+        os.path.splitext(f)[0].split("_")[-1]
+        for f in os.listdir(carpeta)
+        if f.endswith((".kmz", ".kml"))
+    }
+    assert sorted(i for i in antiguos if i not in catalogo) == []
@@ -0,0 +1,21 @@
+import numpy as np
+
+from nucleo.clasificacion import LIMITES, SIN_DATOS, clasificar, histograma
+
+def test_limites_inclusivos():
+    valores = [0.5, 1.0, 1.0001, 2.0, 3.5, 4.0, 5.0]
+    assert clasificar(valores).tolist() == [1, 1, 2, 2, 4, 4, 5]
+    assert clasificar(LIMITES).tolist() == [1, 2, 3, 4, 5]
+
+def test_nan_y_fuera_de_rango_sin_datos():
+    assert clasificar([np.nan, 5.01, 2.5]).tolist() == [SIN_DATOS, SIN_DATOS, 3]
+
+def test_largo_fijo():
+    assert clasificar([1.5], n=3).tolist() == [2, SIN_DATOS, SIN_DATOS]
+    assert clasificar([1.5, 2.5, 3.5], n=2).tolist() == [2, 3]
+    assert clasificar(None, n=2).tolist() == [SIN_DATOS, SIN_DATOS]
+
+def test_histograma_por_fila():
+    codigos = np.array([[1, 1, 0], [5, 2, 2]])
+    assert histograma(codigos).tolist() == [[1, 2, 0, 0, 0, 0], [0, 0, 2, 0, 0, 1]]
+    assert histograma(codigos[1]).tolist() == [0, 0, 2, 0, 0, 1]
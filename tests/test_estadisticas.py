@@ -0,0 +1,14 @@
+import numpy as np
+
+from nucleo.estadisticas import racha_mas_larga
+
+def test_racha_mas_larga():
+    mascara = np.array([
+        [0, 1, 1, 0, 1, 1, 1],
+        [0, 0, 0, 0, 0, 0, 0],
+        [1, 1, 0, 1, 1, 0, 0],  # empate: gana la primera
+        [1, 1, 1, 1, 1, 1, 1],
+    ], dtype=bool)
+    largo, inicio = racha_mas_larga(mascara)
+    assert largo.tolist() == [3, 0, 2, 7]
+    assert inicio.tolist() == [4, -1, 0, 0]
@@ -0,0 +1,17 @@
+from nucleo import fuentes_indices
+from nucleo.fuentes_indices import descubrir_fuentes, etiqueta_tipo
+
+def test_etiqueta_tipo():
+    assert etiqueta_tipo("IMN") == "Mejorado (IMN)"
+    assert etiqueta_tipo("IRNE") == "Real escenario E (IRNE)"
+
+# Un libro nuevo en la carpeta reemplaza la entrada memorizada, no la suma
+def test_memo_una_entrada_por_carpeta(tmp_path):
+    carpeta = str(tmp_path)
+    (tmp_path / "notas.txt").write_text("a")
+    assert descubrir_fuentes(carpeta) == {}
+    firma, entradas = fuentes_indices._fuentes[carpeta][0], len(fuentes_indices._fuentes)
+    (tmp_path / "otro.txt").write_text("b")
+    assert descubrir_fuentes(carpeta) == {}
+    assert fuentes_indices._fuentes[carpeta][0] != firma
+    assert len(fuentes_indices._fuentes) == entradas
@@ -0,0 +1,20 @@
+import numpy as np
+import pytest
+
+from nucleo.geodesia import MODO_ELIPSOIDAL, MODO_HAVERSINE, comparar_con_geopy, distancias_segmentos
+
+# Ambos modos contra geopy en tramos cortos (vértices de GPX) y largos sobre
+# el territorio chileno
+rng = np.random.default_rng(0)
+BASE = np.column_stack([rng.uniform(-75.0, -67.0, 200), rng.uniform(-56.0, -17.0, 200)])
+CORTOS = np.cumsum(np.vstack([BASE[:1], rng.normal(0, 1e-6, (999, 2))]), axis=0)
+
+@pytest.mark.parametrize(
+    "coords, tol_elip, tol_rel_hav",
+    [(CORTOS, 1e-6, 5e-3), (BASE, 1e-3, 5e-3)],
+    ids=["cortos", "largos"],
+)
+def test_modos_contra_geopy(coords, tol_elip, tol_rel_hav):
+    escala = distancias_segmentos(coords).max()
+    assert comparar_con_geopy(coords, MODO_ELIPSOIDAL) <= tol_elip
+    assert comparar_con_geopy(coords, MODO_HAVERSINE) <= tol_rel_hav * escala
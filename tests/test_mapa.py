@@ -0,0 +1,9 @@
+from nucleo.clasificacion import CATEGORIAS, COLOR_SIN_DATOS
+from nucleo.mapa import leyenda_html
+
+def test_leyenda_sale_de_categorias():
+    html = leyenda_html()
+    for _, etiqueta, color, limite in CATEGORIAS:
+        assert f"background-color:{color};" in html
+        assert f"{etiqueta} (≤ {limite:.2f})" in html
+    assert f"background-color:{COLOR_SIN_DATOS};" in html and "Sin datos" in html
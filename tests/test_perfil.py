@@ -0,0 +1,16 @@
+import numpy as np
+
+from nucleo.perfil import lttb
+
+def test_lttb_conserva_extremos():
+    x = np.arange(1000, dtype=np.float64)
+    y = np.sin(x / 30.0)
+    elegidos = lttb(x, y, 50)
+    assert len(elegidos) == 50
+    assert elegidos[0] == 0 and elegidos[-1] == 999
+    assert (np.diff(elegidos) > 0).all()
+
+def test_lttb_pocos_puntos_devuelve_todos():
+    x = np.arange(10, dtype=np.float64)
+    assert lttb(x, x, 10).tolist() == list(range(10))
+    assert lttb(x, x, 2).tolist() == list(range(10))
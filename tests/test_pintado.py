@@ -0,0 +1,7 @@
+from nucleo.pintado import limpiar_temporales
+
+def test_limpiar_temporales_solo_borra_kmz_a_medias(tmp_path):
+    for nombre in ("R-5_pintado.kmz.4242.tmp", "R-5_pintado.kmz", "catalogo.json.1.2.tmp"):
+        (tmp_path / nombre).write_bytes(b"")
+    assert limpiar_temporales(str(tmp_path)) == 1
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["R-5_pintado.kmz", "catalogo.json.1.2.tmp"]
@@ -0,0 +1,38 @@
+import numpy as np
+
+from nucleo.segmentacion import RutaSegmentada, segmentar_por_km
+
+# Trazado sobre el eje x con la distancia acumulada igual a x (en metros)
+def _recta(xs):
+    xs = np.asarray(xs, dtype=np.float64)
+    return np.column_stack([xs, np.zeros_like(xs)]), xs.copy()
+
+def test_marcas_entre_vertices_se_interpolan():
+    coords, dist = _recta([0, 1500, 3000])
+    coords, dist, cortes = segmentar_por_km(coords, dist)
+    assert dist.tolist() == [0, 1000, 1500, 2000, 3000]
+    assert np.allclose(coords[:, 0], dist)
+    assert cortes.tolist() == [0, 1, 3, 4]
+
+def test_marcas_sobre_vertices_no_duplican():
+    coords, dist = _recta([0, 500, 1000, 1700, 2000, 2500])
+    nuevas, dist_nueva, cortes = segmentar_por_km(coords, dist)
+    assert len(nuevas) == len(coords)
+    assert cortes.tolist() == [0, 2, 4, 5]
+    assert dist_nueva[cortes].tolist() == [0, 1000, 2000, 2500]
+
+def test_largo_multiplo_exacto_sin_tramo_vacio():
+    coords, dist = _recta([0, 1000, 2000])
+    coords, dist, cortes = segmentar_por_km(coords, dist)
+    assert cortes.tolist() == [0, 1, 2]
+    assert len(RutaSegmentada(coords, cortes)) == 2
+
+def test_tramos_comparten_vertice_de_corte():
+    coords, dist = _recta(np.linspace(0, 3400, 35))
+    coords, dist, cortes = segmentar_por_km(coords, dist)
+    ruta = RutaSegmentada(coords, cortes)
+    tramos = list(ruta)
+    assert len(tramos) == 4
+    for a, b in zip(tramos[:-1], tramos[1:]):
+        assert (a[-1] == b[0]).all()
+    assert [t[-1, 0] - t[0, 0] for t in tramos] == [1000, 1000, 1000, 400]
@@ -0,0 +1,44 @@
+import numpy as np
+
+from nucleo.simplificacion import (
+    ZOOM_MAXIMO_SIMPLIFICADO,
+    ZOOMS_NIVELES,
+    indices_simplificados,
+    nivel_para_zoom,
+    niveles_simplificados,
+)
+
+def _zigzag(n=2000):
+    x = np.linspace(-71.0, -70.0, n)
+    y = -33.0 + 1e-3 * np.sin(np.arange(n) / 7.0)
+    return np.column_stack([x, y])
+
+def test_recta_queda_en_sus_extremos():
+    xy = np.column_stack([np.linspace(0.0, 1.0, 50), np.zeros(50)])
+    assert indices_simplificados(xy, 1e-9).tolist() == [0, 49]
+
+def test_fijos_y_extremos_se_conservan():
+    xy = _zigzag()
+    fijos = np.array([0, 333, 1000, 1999])
+    indices = indices_simplificados(xy, 1.0, fijos)
+    assert indices.tolist() == fijos.tolist()
+
+def test_niveles_anidados_con_cortes():
+    coords = _zigzag()
+    cortes = np.array([0, 500, 1200, 1999])
+    niveles = niveles_simplificados(coords, cortes)
+    assert sorted(niveles) == sorted(ZOOMS_NIVELES)
+    anterior = None
+    for zoom in sorted(ZOOMS_NIVELES, reverse=True):
+        indices = niveles[zoom]
+        assert np.isin(cortes, indices).all()
+        if anterior is not None:
+            # cada nivel grueso sale del anterior, más fino
+            assert np.isin(indices, anterior).all() and len(indices) <= len(anterior)
+        anterior = indices
+
+def test_nivel_para_zoom():
+    assert nivel_para_zoom(None) is None
+    assert nivel_para_zoom(ZOOM_MAXIMO_SIMPLIFICADO + 1) is None
+    assert nivel_para_zoom(3) == min(ZOOMS_NIVELES)
+    assert nivel_para_zoom(11) == 12